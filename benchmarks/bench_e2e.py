@@ -0,0 +1,131 @@
+"""
+End-to-end benchmark: runs jira_cli.py against the bundled mock Jira server.
+
+Each scenario runs the real CLI in a subprocess, so paging, concurrency, payload
+sizes, retries and parsing are all exercised. For every scenario it reports wall
+time, requests served by the mock (per endpoint with --verbose), bytes sent and
+the peak RSS of the CLI process.
+
+Usage:
+    python benchmarks/bench_e2e.py                                  # full suite
+    python benchmarks/bench_e2e.py --sizes 1000 10000 --only search group-by
+    python benchmarks/bench_e2e.py --latency-ms 20 --throttle-rate 0.02 --json results.json
+    python benchmarks/bench_e2e.py --env JIRA_PARALLEL=8
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "jira_cli.py")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_jira import Dataset, MockJiraServer
+
+JQL = "project = PROJ"
+
+# name -> (CLI arguments for a dataset of `size` issues, whether it runs at every size)
+SCENARIOS = {
+    "search": (lambda size: ["search", "--jql", JQL, "--limit", str(size), "--format", "tsv"], True),
+    "epic-name": (lambda size: ["search", "--jql", JQL, "--limit", str(size), "--format", "tsv", "--epic-name"], False),
+    "group-by": (lambda size: ["search", "--jql", JQL, "--limit", str(size), "--group-by", "Status,Assignee"], False),
+    "pivot": (lambda size: ["search", "--jql", JQL, "--limit", str(size), "--pivot-rows", "Assignee",
+                            "--pivot-cols", "Status", "--pivot-values", "Count,Points"], False),
+    "bulk-edit": (lambda size: ["edit", "--jql", JQL, "--limit", str(size), "--points", "3"], False),
+}
+
+def cli_env(server_url, cache_dir, extra):
+    env = dict(os.environ)
+    env.update({
+        "JIRA_URL": server_url,
+        "JIRA_USERNAME": "bench",
+        "JIRA_PASSWORD": "bench",
+        "JIRA_CACHE_DIR": cache_dir,
+        # Measure the network path, not warm caches from a previous scenario
+        "JIRA_ISSUE_CACHE": "False",
+        "JIRA_SUMMARY_CACHE": "False",
+        "COLUMNS": "120",
+    })
+    env.update(extra)
+    return env
+
+def run_cli(cli_args, env):
+    """
+    Runs the CLI once. Returns (wall seconds, peak RSS in MiB, exit code).
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, SCRIPT] + cli_args, cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    # wait4 gives this child's own rusage; ru_maxrss is in KiB on Linux
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    stderr = proc.stderr.read().decode("utf-8", "replace")
+    proc.stderr.close()
+    if proc.returncode != 0:
+        print(stderr, file=sys.stderr)
+    return elapsed, usage.ru_maxrss / 1024, proc.returncode
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmark against the mock Jira server")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Dataset sizes for the search scenario")
+    parser.add_argument("--report-size", type=int, default=10000,
+                        help="Dataset size for epic-name, group-by, pivot and bulk-edit")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="Run only these scenarios")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server-side delay per request")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 answers")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="Extra environment for the CLI")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Print requests per endpoint")
+    args = parser.parse_args()
+
+    extra = dict(item.split("=", 1) for item in args.env)
+    runs = []
+    for name, (_, every_size) in SCENARIOS.items():
+        if args.only and name not in args.only:
+            continue
+        for size in (args.sizes if every_size else [args.report_size]):
+            runs.append((name, size))
+
+    server = MockJiraServer(("127.0.0.1", 0), Dataset(1), args.latency_ms, args.throttle_rate, args.retry_after).start()
+    results = []
+    print(f"{'scenario':<12} {'issues':>8} {'wall s':>8} {'requests':>9} {'MiB sent':>9} {'peak RSS MiB':>13}")
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = cli_env(server.url, cache_dir, extra)
+            for name, size in runs:
+                server.dataset = Dataset(size)
+                server.reset_stats()
+                elapsed, rss, code = run_cli(SCENARIOS[name][0](size), env)
+                stats = server.stats()
+                result = {
+                    "scenario": name, "issues": size, "wall_s": round(elapsed, 3), "exit_code": code,
+                    "requests": stats["total_requests"], "requests_by_endpoint": stats["requests"],
+                    "bytes_sent": stats["bytes_sent"], "peak_rss_mib": round(rss, 1),
+                }
+                results.append(result)
+                flag = "" if code == 0 else f"  (exit {code})"
+                print(f"{name:<12} {size:>8} {elapsed:>8.2f} {stats['total_requests']:>9} "
+                      f"{stats['bytes_sent'] / 2**20:>9.1f} {rss:>13.1f}{flag}")
+                if args.verbose:
+                    for endpoint, count in sorted(stats["requests"].items()):
+                        print(f"{'':<12} {endpoint:>18}: {count}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"latency_ms": args.latency_ms, "throttle_rate": args.throttle_rate, "env": extra,
+                       "results": results}, f, indent=2)
+    if any(r["exit_code"] != 0 for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
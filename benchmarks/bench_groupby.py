@@ -0,0 +1,82 @@
+"""
+Group-by benchmark: single-pass GroupByAggregator vs the pandas backend.
+
+Both backends consume the same synthetic IssueParser-shaped rows and produce the
+rows handed to display_grouped(); rendering is excluded.
+
+Usage:
+    python benchmarks/bench_groupby.py --rows 1000 5000 20000 --group-by Status,Assignee
+"""
+import os
+import sys
+import argparse
+import random
+import statistics
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jira_cli import GroupByAggregator, IssueRecord, group_issues_pandas
+
+STATUSES = ["To Do", "In Progress", "In Review", "Done", "Blocked"]
+TYPES = ["Story", "Bug", "Task", "Spike"]
+
+def make_issues(count, seed=42):
+    rng = random.Random(seed)
+    assignees = [f"Dev {i}" for i in range(25)] + ["Unassigned"]
+    epics = [f"EPIC-{i}" for i in range(60)] + [""]
+    issues = []
+    for i in range(count):
+        issues.append(IssueRecord(
+            key=f"PROJ-{i}",
+            type=rng.choice(TYPES),
+            summary=f"Synthetic issue {i}",
+            status=rng.choice(STATUSES),
+            priority=rng.choice(["High", "Medium", "Low"]),
+            assignee=rng.choice(assignees),
+            sprint=f"Sprint {rng.randint(1, 30)}",
+            points=rng.choice([None, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0]),
+            epic_link=rng.choice(epics),
+        ))
+    return issues
+
+def run_python(issues, columns):
+    aggregator = GroupByAggregator(columns)
+    aggregator.extend(issues)
+    return aggregator.rows()
+
+def run_pandas(issues, columns):
+    return group_issues_pandas(issues, columns)
+
+def measure(fn, issues, columns, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(issues, columns)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description="Group-by backend benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--group-by", default="Status,Assignee")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    columns = [c.strip() for c in args.group_by.split(",")]
+
+    # Import pandas up front so its one-off import cost is not charged to the first run
+    import pandas  # noqa: F401
+
+    print(f"{'rows':>8} {'python ms':>10} {'pandas ms':>10} {'speedup':>8}")
+    for count in args.rows:
+        issues = make_issues(count)
+        if run_python(issues, columns) != run_pandas(issues, columns):
+            print(f"MISMATCH between backends at {count} rows")
+            sys.exit(1)
+        py_ms = measure(run_python, issues, columns, args.repeat)
+        pd_ms = measure(run_pandas, issues, columns, args.repeat)
+        print(f"{count:>8} {py_ms:>10.2f} {pd_ms:>10.2f} {pd_ms / py_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
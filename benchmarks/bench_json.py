@@ -0,0 +1,116 @@
+"""
+JSON decoding benchmark for search pages.
+
+Compares requests' Response.json() (stdlib decoder on a decoded str copy), the
+stdlib decoder on the raw bytes, and jira_cli.json_loads (orjson when installed).
+
+Pass recorded /search responses to benchmark real pages, e.g.
+    curl -u "$JIRA_USERNAME:$JIRA_API_TOKEN" "$JIRA_URL/rest/api/2/search?jql=...&maxResults=100" > page1.json
+Without arguments, synthetic 100-issue pages with greenhopper sprint strings and
+custom-field blobs are used.
+
+Usage:
+    python benchmarks/bench_json.py [page1.json page2.json ...] --repeat 20
+"""
+import os
+import sys
+import json
+import argparse
+import random
+import statistics
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jira_cli
+
+def make_page(start, size=100, seed=7):
+    rng = random.Random(seed + start)
+    issues = []
+    for i in range(start, start + size):
+        sprints = [
+            f"com.atlassian.greenhopper.service.sprint.Sprint@{rng.randrange(16**6):x}[id={n},rapidViewId=12,"
+            f"state=CLOSED,name=Team A Sprint {n},startDate=2024-01-0{n % 9 + 1}T09:00:00.000Z,"
+            f"endDate=2024-01-1{n % 9 + 1}T17:00:00.000Z,completeDate=<null>,sequence={n}]"
+            for n in range(rng.randint(1, 6))
+        ]
+        issues.append({
+            "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+            "id": str(10000 + i),
+            "self": f"https://jira.example.com/rest/api/2/issue/{10000 + i}",
+            "key": f"PROJ-{i}",
+            "fields": {
+                "summary": f"Synthetic issue {i} " + "lorem ipsum " * rng.randint(2, 10),
+                "status": {"name": rng.choice(["To Do", "In Progress", "Done"]), "id": "3",
+                           "statusCategory": {"id": 4, "key": "indeterminate", "colorName": "yellow"}},
+                "assignee": {"displayName": f"Dev {rng.randint(0, 25)}", "active": True, "timeZone": "Europe/Berlin",
+                             "avatarUrls": {size: f"https://jira.example.com/avatar/{i}?s={size}" for size in ("16x16", "24x24", "32x32", "48x48")}},
+                "priority": {"name": rng.choice(["High", "Medium", "Low"]), "id": "3"},
+                "issuetype": {"name": rng.choice(["Story", "Bug", "Task"]), "subtask": False},
+                "customfield_10004": sprints,
+                "customfield_10006": rng.choice([None, 1.0, 2.0, 3.0, 5.0, 8.0]),
+                "customfield_10000": f"EPIC-{rng.randint(1, 60)}",
+                "created": "2024-01-01T10:00:00.000+0000",
+                "updated": "2024-02-01T10:00:00.000+0000",
+            },
+        })
+    return json.dumps({"startAt": start, "maxResults": size, "total": 10000, "issues": issues}).encode("utf-8")
+
+def load_pages(paths):
+    if not paths:
+        return [make_page(start) for start in range(0, 1000, 100)]
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append(f.read())
+    return pages
+
+def as_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+def measure(fn, pages, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            fn(page)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description="Search page JSON decoding benchmark")
+    parser.add_argument("pages", nargs="*", help="Recorded /search response bodies (default: synthetic pages)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    size_kb = sum(len(p) for p in pages) / 1024
+
+    decoders = [
+        ("Response.json()", lambda body: as_response(body).json()),
+        ("json.loads(bytes)", json.loads),
+    ]
+    if jira_cli.json_decoder() is not json.loads:
+        decoders.append(("json_loads (orjson)", jira_cli.json_loads))
+    else:
+        print("orjson is not installed; json_loads uses the stdlib decoder")
+
+    expected = [json.loads(p) for p in pages]
+    print(f"{len(pages)} pages, {size_kb:.0f} KiB total")
+    print(f"{'decoder':<22} {'ms':>8} {'speedup':>8}")
+    baseline = None
+    for name, fn in decoders:
+        if [fn(p) for p in pages] != expected:
+            print(f"MISMATCH from {name}")
+            sys.exit(1)
+        ms = measure(fn, pages, args.repeat)
+        baseline = baseline or ms
+        print(f"{name:<22} {ms:>8.2f} {baseline / ms:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
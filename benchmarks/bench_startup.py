@@ -0,0 +1,73 @@
+"""
+Startup benchmark for jira_cli.py.
+
+Measures the wall time of `jira_cli.py view --help` (module import plus argument
+parsing, no network) and fails when the median exceeds the budget or when a
+heavy dependency is imported eagerly. Launches are timed warm, with jira_core's
+bytecode cached as it is after the first real run.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 10 --budget-ms 400
+"""
+import os
+import sys
+import argparse
+import py_compile
+import statistics
+import subprocess
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "jira_cli.py")
+
+# Modules that only the reporting paths (group-by, pivot) may load
+LAZY_MODULES = ["pandas", "numpy", "rich.table", "rich.progress"]
+
+def time_view_startup(runs):
+    # Written explicitly so the timing does not depend on PYTHONDONTWRITEBYTECODE
+    py_compile.compile(os.path.join(ROOT, "jira_core.py"), doraise=True)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, SCRIPT, "view", "--help"],
+            cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def eagerly_imported():
+    code = (
+        "import sys, jira_cli; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+def main():
+    parser = argparse.ArgumentParser(description="jira_cli.py startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Number of timed launches")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("JIRA_STARTUP_BUDGET_MS", "400")),
+                        help="Maximum allowed median startup time in milliseconds")
+    args = parser.parse_args()
+
+    eager = eagerly_imported()
+    samples = time_view_startup(args.runs)
+    median = statistics.median(samples)
+
+    print(f"view startup: median {median:.1f} ms, min {min(samples):.1f} ms, max {max(samples):.1f} ms ({args.runs} runs)")
+    print(f"budget: {args.budget_ms:.1f} ms")
+
+    failed = False
+    if eager:
+        print(f"FAIL: imported at module load: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: median startup {median:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,556 @@
+"""
+Stand-in Jira server for end-to-end tests and benchmarks.
+
+Serves a synthetic, deterministic dataset over the endpoints jira_cli.py uses:
+    GET  /rest/api/2/search                  (JQL subset, paging, field projection)
+    GET  /rest/api/2/issue/{key}
+    POST /rest/api/2/issue, /rest/api/2/issue/bulk
+    PUT  /rest/api/2/issue/{key}
+    GET  /rest/agile/1.0/board/{id}/sprint
+Latency and 429 answers can be injected, and every request is counted per endpoint.
+
+The JQL subset covers what the CLI sends: AND/OR/NOT, parentheses, =, !=, >=, <=, >, <,
+in / not in, and ORDER BY key, created or updated. Clauses on fields the server does
+not know match every issue.
+
+Usage:
+    python benchmarks/mock_jira.py --issues 10000 --port 8080 --latency-ms 20 --throttle-rate 0.01
+    JIRA_URL=http://127.0.0.1:8080 JIRA_USERNAME=x JIRA_PASSWORD=x python jira_cli.py search --jql "project = PROJ"
+"""
+import re
+import sys
+import gzip
+import json
+import random
+import argparse
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+STATUSES = ["To Do", "In Progress", "In Review", "Done", "Blocked"]
+TYPES = ["Story", "Bug", "Task", "Spike"]
+PRIORITIES = ["Highest", "High", "Medium", "Low"]
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Jira caps page sizes; the CLI asks for 100 issues and 50 sprints per page
+MAX_SEARCH_RESULTS = 100
+MAX_SPRINT_RESULTS = 50
+
+def jira_timestamp(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+class Dataset:
+    """
+    Deterministic issues PROJ-1..PROJ-N, generated on demand so 100k issues stay cheap.
+    The first N/100 issues are epics that every other issue may link to.
+    Edits and created issues are kept as overrides on top of the generated data.
+    """
+    def __init__(self, size, project="PROJ", sprints=20, board_id=1, seed=42,
+                 field_story_points="customfield_10006", field_sprints="customfield_10004",
+                 field_epic_link="customfield_10000"):
+        self.size = size
+        self.project = project
+        self.sprint_count = sprints
+        self.board_id = board_id
+        self.seed = seed
+        self.epics = max(1, size // 100)
+        self.assignees = [f"Dev {i}" for i in range(25)]
+        self.field_story_points = field_story_points
+        self.field_sprints = field_sprints
+        self.field_epic_link = field_epic_link
+        self.overrides = {}
+        self.created = []
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def sprints(self):
+        return [
+            {"id": 100 + n, "name": f"Sprint {n}", "state": "closed" if n < self.sprint_count else "active",
+             "originBoardId": self.board_id}
+            for n in range(1, self.sprint_count + 1)
+        ]
+
+    def _sprint_value(self, n):
+        state = "CLOSED" if n < self.sprint_count else "ACTIVE"
+        return (f"com.atlassian.greenhopper.service.sprint.Sprint@{n:x}[id={100 + n},rapidViewId={self.board_id},"
+                f"state={state},name=Sprint {n},startDate=<null>,endDate=<null>,completeDate=<null>,sequence={100 + n}]")
+
+    def count(self):
+        return self.size + len(self.created)
+
+    def index_of(self, key):
+        prefix, _, number = key.partition("-")
+        if prefix != self.project or not number.isdigit():
+            return None
+        index = int(number) - 1
+        return index if 0 <= index < self.count() else None
+
+    def issue(self, index):
+        key = f"{self.project}-{index + 1}"
+        if index >= self.size:
+            fields = dict(self.created[index - self.size])
+        else:
+            fields = self._generate(index)
+        override = self.overrides.get(index)
+        if override:
+            fields.update(override)
+        return {"id": str(10000 + index), "key": key, "self": f"/rest/api/2/issue/{10000 + index}", "fields": fields}
+
+    def _generate(self, index):
+        rng = random.Random(self.seed * 1000003 + index)
+        created = EPOCH + timedelta(minutes=index)
+        is_epic = index < self.epics
+        sprint = rng.randint(1, self.sprint_count)
+        return {
+            "summary": f"{'Epic' if is_epic else 'Issue'} {index + 1}: " + " ".join(["synthetic text"] * rng.randint(1, 8)),
+            "issuetype": {"name": "Epic" if is_epic else rng.choice(TYPES), "subtask": False},
+            "status": {"name": rng.choice(STATUSES)},
+            "priority": {"name": rng.choice(PRIORITIES)},
+            "assignee": None if rng.random() < 0.1 else {"displayName": rng.choice(self.assignees)},
+            self.field_story_points: rng.choice([None, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0]),
+            self.field_sprints: [self._sprint_value(n) for n in range(max(1, sprint - 1), sprint + 1)],
+            self.field_epic_link: None if is_epic else f"{self.project}-{rng.randint(1, self.epics)}",
+            "created": jira_timestamp(created),
+            "updated": jira_timestamp(created + timedelta(hours=rng.randint(0, 48))),
+        }
+
+    def create(self, fields):
+        fields = dict(fields)
+        now = jira_timestamp(datetime.now(timezone.utc))
+        fields.setdefault("created", now)
+        fields["updated"] = now
+        with self.lock:
+            self.created.append(fields)
+            self.version += 1
+            return self.count() - 1
+
+    def update(self, index, fields):
+        with self.lock:
+            override = self.overrides.setdefault(index, {})
+            override.update(fields)
+            override["updated"] = jira_timestamp(datetime.now(timezone.utc))
+            self.version += 1
+
+    def search(self, jql):
+        """
+        Returns the ordered issue indexes matching a JQL string. Results are cached
+        per dataset version so paging through a large result evaluates it once.
+        """
+        return _search(self, jql, self.version)
+
+@lru_cache(maxsize=32)
+def _search(dataset, jql, version):
+    where, order_field, descending = split_order(jql)
+    predicate, keys = compile_jql(where, dataset)
+    if keys is not None:
+        indexes = sorted(i for i in (dataset.index_of(k) for k in keys) if i is not None)
+    else:
+        indexes = range(dataset.count())
+    if predicate is not None:
+        indexes = [i for i in indexes if predicate(dataset.issue(i))]
+    if order_field in ("created", "updated"):
+        indexes = sorted(indexes, key=lambda i: dataset.issue(i)["fields"][order_field])
+    if descending:
+        indexes = list(reversed(indexes))
+    return indexes
+
+def split_order(jql):
+    match = re.search(r"\s*\bORDER\s+BY\s+(\w+)(?:\s+(ASC|DESC))?.*$", jql, flags=re.IGNORECASE | re.DOTALL)
+    if not match:
+        return jql.strip(), "key", False
+    return jql[:match.start()].strip(), match.group(1).lower(), (match.group(2) or "").upper() == "DESC"
+
+_TOKEN = re.compile(r'\s*(?:"((?:[^"\\]|\\.)*)"|\'([^\']*)\'|(>=|<=|!=|=|>|<|\(|\)|,)|([^\s()=!<>,"]+))')
+
+def tokenize(jql):
+    tokens = []
+    pos = 0
+    jql = jql.strip()
+    while pos < len(jql):
+        match = _TOKEN.match(jql, pos)
+        if not match:
+            raise ValueError(f"Cannot parse JQL near '{jql[pos:]}'")
+        pos = match.end()
+        if match.group(1) is not None or match.group(2) is not None:
+            tokens.append(("str", match.group(1) if match.group(1) is not None else match.group(2)))
+        elif match.group(3):
+            tokens.append(("op", match.group(3)))
+        elif match.group(4):
+            tokens.append(("word", match.group(4)))
+    return tokens
+
+def compile_jql(where, dataset):
+    """
+    Compiles a JQL filter into (predicate, keys). predicate is None when every issue
+    matches; keys is a key list when the filter is a plain `key in (...)`, so lookups
+    skip the full scan.
+    """
+    if not where:
+        return None, None
+    parser = _JqlParser(tokenize(where), dataset)
+    node = parser.expression()
+    if parser.pos != len(parser.tokens):
+        raise ValueError(f"Unexpected token '{parser.tokens[parser.pos][1]}'")
+    if node[0] == "keys":
+        return None, node[1]
+    return node[1], None
+
+class _JqlParser:
+    """
+    Recursive-descent parser producing ("all", None), ("keys", [...]) or ("pred", fn) nodes.
+    """
+    FIELD_PATHS = {
+        "status": ("status", "name"),
+        "priority": ("priority", "name"),
+        "assignee": ("assignee", "displayName"),
+        "type": ("issuetype", "name"),
+        "issuetype": ("issuetype", "name"),
+        "summary": ("summary",),
+        "created": ("created",),
+        "updated": ("updated",),
+    }
+
+    def __init__(self, tokens, dataset):
+        self.tokens = tokens
+        self.pos = 0
+        self.dataset = dataset
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def keyword(self, word):
+        kind, value = self.peek()
+        if kind == "word" and value.upper() == word:
+            self.pos += 1
+            return True
+        return False
+
+    def expression(self):
+        node = self.conjunction()
+        while self.keyword("OR"):
+            node = self.combine(node, self.conjunction(), any)
+        return node
+
+    def conjunction(self):
+        node = self.term()
+        while self.keyword("AND"):
+            node = self.combine(node, self.term(), all)
+        return node
+
+    def combine(self, left, right, mode):
+        if mode is all:
+            if left[0] == "all":
+                return right
+            if right[0] == "all":
+                return left
+        elif left[0] == "all" or right[0] == "all":
+            return ("all", None)
+        a, b = self.predicate(left), self.predicate(right)
+        return ("pred", lambda issue: mode((a(issue), b(issue))))
+
+    def predicate(self, node):
+        if node[0] == "keys":
+            keys = set(node[1])
+            return lambda issue: issue["key"] in keys
+        if node[0] == "all":
+            return lambda issue: True
+        return node[1]
+
+    def term(self):
+        if self.keyword("NOT"):
+            inner = self.predicate(self.term())
+            return ("pred", lambda issue: not inner(issue))
+        if self.peek() == ("op", "("):
+            self.take()
+            node = self.expression()
+            if self.take() != ("op", ")"):
+                raise ValueError("Missing ')'")
+            return node
+        return self.clause()
+
+    def clause(self):
+        field = self.take()[1].lower()
+        if self.keyword("NOT"):
+            if not self.keyword("IN"):
+                raise ValueError("Expected IN after NOT")
+            op = "not in"
+        elif self.keyword("IN"):
+            op = "in"
+        else:
+            kind, op = self.take()
+            if kind != "op":
+                raise ValueError(f"Expected an operator after '{field}'")
+        if op in ("in", "not in"):
+            if self.take() != ("op", "("):
+                raise ValueError("Expected '(' after IN")
+            values = []
+            while self.peek() != ("op", ")"):
+                kind, value = self.take()
+                if kind is None:
+                    raise ValueError("Missing ')'")
+                if kind != "op":
+                    values.append(value)
+            self.take()
+        else:
+            values = [self.take()[1]]
+
+        if field in ("key", "issuekey") and op == "in":
+            return ("keys", values)
+        if field in ("key", "issuekey") and op == "=":
+            return ("keys", values)
+        if field == "project":
+            match = op in ("=", "in") and self.dataset.project in values
+            return ("all", None) if match else ("pred", lambda issue: False)
+        getter = self.getter(field)
+        if getter is None:
+            return ("all", None)
+        if field in ("created", "updated"):
+            # JQL dates look like "2024/01/01 10:30"; compare in that format
+            def getter(issue, raw=getter):
+                value = raw(issue) or ""
+                return value[:16].replace("-", "/").replace("T", " ")
+        return ("pred", self.compare(getter, op, values))
+
+    def getter(self, field):
+        if field == "sprint":
+            sprints = self.dataset.field_sprints
+            pattern = re.compile(r"name=([^,\]]*)")
+            return lambda issue: [m.group(1) for s in issue["fields"].get(sprints) or [] for m in [pattern.search(s)] if m]
+        if field in ("epic link", '"epic link"', "epiclink"):
+            epic = self.dataset.field_epic_link
+            return lambda issue: issue["fields"].get(epic)
+        if field == "key":
+            return lambda issue: issue["key"]
+        path = self.FIELD_PATHS.get(field)
+        if path is None:
+            return None
+
+        def get(issue):
+            value = issue["fields"]
+            for part in path:
+                value = value.get(part) if isinstance(value, dict) else None
+            return value
+        return get
+
+    @staticmethod
+    def compare(getter, op, values):
+        def matches(issue):
+            value = getter(issue)
+            candidates = value if isinstance(value, list) else [value]
+            if op in ("=", "in"):
+                return any(c in values for c in candidates)
+            if op in ("!=", "not in"):
+                return not any(c in values for c in candidates)
+            target = values[0]
+            value = candidates[-1] if candidates else None
+            if value is None:
+                return False
+            return {">=": value >= target, "<=": value <= target, ">": value > target, "<": value < target}[op]
+        return matches
+
+class MockJiraServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server holding the dataset, fault injection settings and request counters.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, dataset, latency_ms=0.0, throttle_rate=0.0, retry_after=1, seed=0):
+        super().__init__(address, MockJiraHandler)
+        self.dataset = dataset
+        self.latency_ms = latency_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.stats_lock = threading.Lock()
+        self.requests = Counter()
+        self.bytes_sent = 0
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, endpoint, size):
+        with self.stats_lock:
+            self.requests[endpoint] += 1
+            self.bytes_sent += size
+
+    def stats(self):
+        with self.stats_lock:
+            return {"requests": dict(self.requests), "total_requests": sum(self.requests.values()), "bytes_sent": self.bytes_sent}
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests.clear()
+            self.bytes_sent = 0
+
+    def should_throttle(self):
+        with self.stats_lock:
+            return self.throttle_rate > 0 and self.rng.random() < self.throttle_rate
+
+    def start(self):
+        """
+        Serves in a background daemon thread and returns self.
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    ROUTES = [
+        ("GET", re.compile(r"^/rest/api/\d/search$"), "search"),
+        ("POST", re.compile(r"^/rest/api/\d/issue/bulk$"), "bulk_create"),
+        ("POST", re.compile(r"^/rest/api/\d/issue$"), "create"),
+        ("GET", re.compile(r"^/rest/api/\d/issue/(?P<key>[^/]+)$"), "get_issue"),
+        ("PUT", re.compile(r"^/rest/api/\d/issue/(?P<key>[^/]+)$"), "edit_issue"),
+        ("GET", re.compile(r"^/rest/agile/1\.0/board/(?P<board>\d+)/sprint$"), "board_sprints"),
+    ]
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def dispatch(self, method):
+        parts = urlsplit(self.path)
+        body = self.read_body()
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.match(parts.path)
+            if route_method == method and match:
+                break
+        else:
+            return self.reply("unknown", 404, {"errorMessages": [f"No route for {method} {parts.path}"]})
+
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000.0)
+        if self.server.should_throttle():
+            return self.reply(name, 429, {"errorMessages": ["Rate limit exceeded"]},
+                              headers={"Retry-After": str(self.server.retry_after)})
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        try:
+            status, payload = getattr(self, name)(params=params, body=body, **match.groupdict())
+        except ValueError as e:
+            status, payload = 400, {"errorMessages": [str(e)]}
+        self.reply(name, status, payload)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length))
+
+    def reply(self, endpoint, status, payload, headers=None):
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        if "gzip" in (self.headers.get("Accept-Encoding") or "") and len(data) > 1024:
+            data = gzip.compress(data, compresslevel=5)
+            self.send_header("Content-Encoding", "gzip")
+        if payload is not None:
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        # Counted before the body goes out, so a client that has its answer sees it in stats()
+        self.server.record(endpoint, len(data))
+        self.wfile.write(data)
+
+    # Endpoints return (status, payload)
+
+    def search(self, params, body):
+        dataset = self.server.dataset
+        indexes = dataset.search(params.get("jql", ""))
+        start = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), MAX_SEARCH_RESULTS)
+        wanted = [f for f in params.get("fields", "*all").split(",") if f]
+        project_all = any(f in ("*all", "*navigable") for f in wanted)
+        issues = []
+        for index in indexes[start:start + max_results]:
+            issue = dataset.issue(index)
+            if not project_all:
+                issue["fields"] = {f: issue["fields"].get(f) for f in wanted if f in issue["fields"]}
+            issues.append(issue)
+        return 200, {"startAt": start, "maxResults": max_results, "total": len(indexes), "issues": issues}
+
+    def get_issue(self, params, body, key):
+        index = self.server.dataset.index_of(key)
+        if index is None:
+            return 404, {"errorMessages": ["Issue Does Not Exist"], "errors": {}}
+        return 200, self.server.dataset.issue(index)
+
+    def create(self, params, body):
+        fields = (body or {}).get("fields") or {}
+        if not fields.get("summary"):
+            return 400, {"errorMessages": [], "errors": {"summary": "You must specify a summary of the issue."}}
+        index = self.server.dataset.create(fields)
+        key = f"{self.server.dataset.project}-{index + 1}"
+        return 201, {"id": str(10000 + index), "key": key, "self": f"/rest/api/2/issue/{10000 + index}"}
+
+    def bulk_create(self, params, body):
+        issues, errors = [], []
+        for number, update in enumerate((body or {}).get("issueUpdates", [])):
+            status, payload = self.create(params, update)
+            if status == 201:
+                issues.append(payload)
+            else:
+                errors.append({"status": status, "failedElementNumber": number, "elementErrors": payload})
+        return 201, {"issues": issues, "errors": errors}
+
+    def edit_issue(self, params, body, key):
+        index = self.server.dataset.index_of(key)
+        if index is None:
+            return 404, {"errorMessages": ["Issue Does Not Exist"], "errors": {}}
+        self.server.dataset.update(index, (body or {}).get("fields") or {})
+        return 204, None
+
+    def board_sprints(self, params, body, board):
+        if int(board) != self.server.dataset.board_id:
+            return 404, {"errorMessages": [f"Board {board} does not exist"]}
+        sprints = self.server.dataset.sprints()
+        start = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), MAX_SPRINT_RESULTS)
+        values = sprints[start:start + max_results]
+        return 200, {"maxResults": max_results, "startAt": start, "isLast": start + len(values) >= len(sprints), "values": values}
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in Jira server over a synthetic dataset")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=1000, help="Number of synthetic issues")
+    parser.add_argument("--sprints", type=int, default=20, help="Sprints on board 1")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every request")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 answers")
+    args = parser.parse_args()
+
+    dataset = Dataset(args.issues, sprints=args.sprints)
+    server = MockJiraServer((args.host, args.port), dataset, args.latency_ms, args.throttle_rate, args.retry_after)
+    print(f"Mock Jira with {args.issues} issues on {server.url} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.stats(), indent=2), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
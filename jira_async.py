@@ -0,0 +1,161 @@
+"""
+asyncio client for services that embed the Jira CLI's transport in an event loop.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from jira_core import BULK_CHUNK_SIZE, PAGE_SIZE, JiraAPIError, JiraClient
+
+class AsyncJiraClient:
+    """
+    asyncio interface to Jira for callers that run an event loop.
+    Shares JiraClient's transport (keep-alive pool, retries, rate limiting, metrics); each blocking
+    request runs on a private thread pool, and a semaphore bounds how many are in flight.
+    Unlike the CLI paths, search errors raise JiraAPIError or requests exceptions instead of exiting.
+
+        async with AsyncJiraClient(config) as jira:
+            issues = await jira.search_issues("project = PROJ", limit=500)
+    """
+    def __init__(self, config, summary_cache=None, concurrency=None, client=None):
+        self.config = config
+        self.concurrency = max(1, concurrency or config.parallel)
+        # A client passed in stays owned by the caller
+        self.owns_client = client is None
+        self.client = client or JiraClient(config, summary_cache=summary_cache)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="jira-async")
+        self.semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+    async def _call(self, fn, *args, **kwargs):
+        import asyncio
+
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, lambda: fn(*args, **kwargs))
+
+    async def iter_search_pages(self, jql, limit=100, fields=None, start_at=0):
+        """
+        Async generator over up to `limit` search results, one page at a time, in JQL order.
+        After the first page, up to `concurrency` pages are fetched ahead.
+        """
+        import asyncio
+
+        url = f"{self.config.jira_url}{self.config.endpoint_search}"
+        fields_param = ",".join(fields if fields is not None else self.client.default_search_fields())
+        page_size = min(limit, PAGE_SIZE)
+        data = await self._call(self.client._search_page, url, jql, start_at, page_size, fields_param)
+        issues = data.get("issues", [])[:limit]
+        fetched = len(issues)
+        yield issues
+
+        total = data.get("total")
+        if len(issues) < page_size or fetched >= limit:
+            return
+
+        if total is None:
+            # No total reported: walk startAt one page at a time
+            start_at += fetched
+            while fetched < limit:
+                max_results = min(limit - fetched, PAGE_SIZE)
+                data = await self._call(self.client._search_page, url, jql, start_at, max_results, fields_param)
+                issues = data.get("issues", [])
+                fetched += len(issues)
+                yield issues
+                if len(issues) < max_results:
+                    return
+                start_at += len(issues)
+            return
+
+        target = min(total, start_at + limit)
+        offsets = iter(range(start_at + fetched, target, page_size))
+        pending = deque()
+
+        def schedule_next():
+            start = next(offsets, None)
+            if start is not None:
+                pending.append(asyncio.ensure_future(
+                    self._call(self.client._search_page, url, jql, start, min(page_size, target - start), fields_param)
+                ))
+
+        try:
+            for _ in range(self.concurrency):
+                schedule_next()
+            while pending:
+                issues = (await pending.popleft()).get("issues", [])[:limit - fetched]
+                schedule_next()
+                fetched += len(issues)
+                yield issues
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def search_issues(self, jql, limit=100, fields=None):
+        return [issue async for page in self.iter_search_pages(jql, limit, fields) for issue in page]
+
+    async def get_issue(self, key):
+        return await self._call(self.client.get_issue, key)
+
+    async def get_epic_summary(self, epic_link):
+        return await self._call(self.client.get_epic_summary, epic_link)
+
+    async def resolve_epic_summaries(self, epic_links):
+        """
+        Resolves many epic summaries with concurrent chunked `key in (...)` searches.
+        Returns the shared epic cache, with "Error" for keys Jira did not return.
+        """
+        import asyncio
+
+        pending = await self._call(self.client._pending_epics, list(epic_links))
+        chunks = [pending[i:i + PAGE_SIZE] for i in range(0, len(pending), PAGE_SIZE)]
+        results = await asyncio.gather(
+            *(self._call(self.client._fetch_epic_chunk, chunk) for chunk in chunks), return_exceptions=True
+        )
+        for chunk, found in zip(chunks, results):
+            if isinstance(found, (JiraAPIError, requests.exceptions.RequestException)):
+                found = {}
+            elif isinstance(found, BaseException):
+                raise found
+            await self._call(self.client._store_epic_chunk, chunk, found)
+        return self.client.epic_cache
+
+    async def create_issue(self, fields):
+        return await self._call(self.client.create_issue, fields)
+
+    async def create_issues_bulk(self, field_list):
+        """
+        Creates issues through the bulk endpoint, BULK_CHUNK_SIZE per request, chunks concurrently.
+        Returns one (key, error) pair per input, in order.
+        """
+        import asyncio
+
+        chunks = [field_list[i:i + BULK_CHUNK_SIZE] for i in range(0, len(field_list), BULK_CHUNK_SIZE)]
+        results = await asyncio.gather(*(self._call(self.client._create_issue_chunk, chunk) for chunk in chunks))
+        return [result for chunk_results in results for result in chunk_results]
+
+    async def edit_issue(self, key, fields):
+        return await self._call(self.client.edit_issue, key, fields)
+
+    async def edit_issues_bulk(self, keys, fields):
+        """
+        Applies the same field update to many issues with concurrent PUTs.
+        Returns one (key, error) pair per key, in order; error is None on success.
+        """
+        import asyncio
+
+        errors = await asyncio.gather(*(self._call(self.client._put_issue, key, fields) for key in keys))
+        return list(zip(keys, errors))
+
+    async def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.owns_client:
+            self.client.close()
@@ -0,0 +1,2832 @@
+import os
+import re
+import csv
+import sys
+import json
+import threading
+import time
+import random
+import argparse
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from dotenv import load_dotenv
+from rich.console import Console
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from collections import deque, namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+
+# Initialize Rich Console
+console = Console()
+
+# Jira caps maxResults for /search at 100 on most instances
+PAGE_SIZE = 100
+
+# Issues per request to the bulk create endpoint (Jira accepts up to 50)
+BULK_CHUNK_SIZE = 50
+
+# Transient server answers worth retrying for idempotent requests
+RETRY_STATUSES = (502, 503, 504)
+
+# Names implemented in modules that only the commands using them import
+LAZY_EXPORTS = {
+    "AsyncJiraClient": "jira_async",
+    "ExportCheckpoint": "jira_export",
+    "run_export": "jira_export",
+    "SearchWatcher": "jira_watch",
+    "run_watch": "jira_watch",
+    "watch_search": "jira_watch",
+    "Session": "jira_daemon",
+    "run_shell": "jira_daemon",
+    "DaemonServer": "jira_daemon",
+    "daemon_request": "jira_daemon",
+    "run_daemon": "jira_daemon",
+    "start_daemon": "jira_daemon",
+    "run_daemon_control": "jira_daemon",
+}
+
+def __getattr__(name):
+    """
+    Resolves LAZY_EXPORTS on first access, so `from jira_cli import Session` still works.
+    """
+    module = LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module), name)
+
+@lru_cache(maxsize=None)
+def json_decoder():
+    """
+    Returns orjson.loads when the optional orjson package is installed, else json.loads.
+    Imported on first use so commands that never decode a page do not pay for it.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+def json_loads(data):
+    """
+    Decodes JSON from bytes or str with the fastest available decoder.
+    """
+    return json_decoder()(data)
+
+def parse_retry_after(value):
+    """
+    Returns the delay in seconds from a Retry-After header (seconds or HTTP date), or None.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting requests per second across all worker threads.
+    A rate of 0 disables limiting.
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = max(1.0, capacity or rate or 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float("inf"))
+
+# Issue keys and board IDs in URLs are folded so metrics group by endpoint
+_ENDPOINT_IDS = [
+    (re.compile(r"/issue/[A-Za-z][A-Za-z0-9_]*-\d+"), "/issue/{key}"),
+    (re.compile(r"/board/\d+"), "/board/{id}"),
+]
+
+def endpoint_label(method, url):
+    """
+    Returns "METHOD /path" for a request URL with issue keys and board IDs replaced by placeholders.
+    """
+    path = re.sub(r"^[a-z]+://[^/]+", "", url.split("?", 1)[0])
+    for pattern, placeholder in _ENDPOINT_IDS:
+        path = pattern.sub(placeholder, path)
+    return f"{method.upper()} {path}"
+
+def response_size(response):
+    """
+    Bytes received for a response: the Content-Length sent on the wire (compressed), else the body length.
+    """
+    length = response.headers.get("Content-Length")
+    if isinstance(length, str) and length.isdigit():
+        return int(length)
+    content = response.content
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+class Metrics:
+    """
+    Thread-safe run instrumentation: wall time per phase, HTTP requests per endpoint
+    (count, retries, status codes, bytes received, latencies) and cache hits/misses.
+    Collection is always on; `--profile` prints it and `--metrics-out` writes it as JSON.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.perf_counter()
+            self.phases = {}
+            self.endpoints = {}
+            self.caches = {}
+
+    def phase(self, name):
+        return _PhaseTimer(self, name)
+
+    def add_phase(self, name, seconds):
+        with self.lock:
+            entry = self.phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+            entry["seconds"] += seconds
+            entry["calls"] += 1
+
+    def timed_pages(self, name, pages):
+        """
+        Yields from `pages`, charging the time spent waiting for each page to phase `name`.
+        """
+        pages = iter(pages)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    return
+                finally:
+                    self.add_phase(name, time.perf_counter() - start)
+                yield page
+        finally:
+            # Stop the producer (and its in-flight requests) if the consumer stops early
+            if hasattr(pages, "close"):
+                pages.close()
+
+    def record_request(self, endpoint, status, seconds, size=0, retry=False):
+        with self.lock:
+            entry = self.endpoints.setdefault(endpoint, {"requests": 0, "retries": 0, "bytes": 0, "statuses": {}, "latencies": []})
+            entry["requests"] += 1
+            entry["retries"] += int(retry)
+            entry["bytes"] += size
+            entry["statuses"][str(status)] = entry["statuses"].get(str(status), 0) + 1
+            entry["latencies"].append(seconds)
+
+    def record_cache(self, name, hits=0, misses=0):
+        with self.lock:
+            entry = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+            entry["hits"] += hits
+            entry["misses"] += misses
+
+    def snapshot(self):
+        """
+        Returns the collected metrics as a JSON-serializable dict.
+        """
+        info = _decode_sprint_string.cache_info()
+        with self.lock:
+            endpoints = {}
+            for endpoint, entry in self.endpoints.items():
+                latencies = sorted(entry["latencies"])
+                histogram = [0] * len(LATENCY_BUCKETS)
+                for seconds in latencies:
+                    histogram[next(i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound)] += 1
+                endpoints[endpoint] = {
+                    "requests": entry["requests"],
+                    "retries": entry["retries"],
+                    "bytes": entry["bytes"],
+                    "statuses": dict(entry["statuses"]),
+                    "latency_ms": {
+                        "mean": round(1000 * sum(latencies) / len(latencies), 2),
+                        "p50": round(1000 * latencies[len(latencies) // 2], 2),
+                        "p95": round(1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+                        "max": round(1000 * latencies[-1], 2),
+                    },
+                    "latency_histogram": {
+                        ("+inf" if bound == float("inf") else f"<={int(bound * 1000)}ms"): count
+                        for bound, count in zip(LATENCY_BUCKETS, histogram)
+                    },
+                }
+            caches = {name: dict(entry) for name, entry in self.caches.items()}
+            phases = {name: {"seconds": round(e["seconds"], 4), "calls": e["calls"]} for name, e in self.phases.items()}
+            total = time.perf_counter() - self.started
+        if info.hits or info.misses:
+            caches["sprint_decode"] = {"hits": info.hits, "misses": info.misses}
+        for entry in caches.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / lookups, 4) if lookups else None
+        return {"total_seconds": round(total, 4), "phases": phases, "http": endpoints, "caches": caches}
+
+class _PhaseTimer:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add_phase(self.name, time.perf_counter() - self.start)
+        return False
+
+metrics = Metrics()
+
+class JiraAPIError(Exception):
+    """
+    Raised when Jira answers with an unexpected status code.
+    """
+    def __init__(self, status_code, text=""):
+        super().__init__(f"Jira API error {status_code}")
+        self.status_code = status_code
+        self.text = text
+
+class ConfigLoader:
+    """
+    Loads configuration from environment variables.
+    """
+    def __init__(self):
+        load_dotenv()
+        self.jira_url = os.getenv("JIRA_URL")
+        self.username = os.getenv("JIRA_USERNAME")
+        self.password = os.getenv("JIRA_PASSWORD")
+        
+        # API Endpoints
+        self.endpoint_search = os.getenv("JIRA_API_SEARCH_ENDPOINT", "/rest/api/2/search")
+        self.endpoint_issue = os.getenv("JIRA_API_ISSUE_ENDPOINT", "/rest/api/2/issue")
+        self.endpoint_agile = os.getenv("JIRA_API_AGILE_ENDPOINT", "/rest/agile/1.0")
+
+        # Boards whose sprints are indexed for name -> ID lookups (comma-separated IDs)
+        self.board_ids = [b.strip() for b in os.getenv("JIRA_BOARD_IDS", "").split(",") if b.strip()]
+        self.sprint_ttl = int(os.getenv("JIRA_SPRINT_TTL", "3600"))
+        
+        # Custom Fields Mapping
+        self.field_story_points = os.getenv("FIELD_STORY_POINTS", "customfield_10006")
+        self.field_sprints = os.getenv("FIELD_SPRINTS", "customfield_10004")
+        self.field_epic_link = os.getenv("FIELD_EPIC_LINK", "customfield_10000")
+        self.field_activity_type = os.getenv("FIELD_ACTIVITY_TYPE", "customfield_12203")
+        self.field_root_request = os.getenv("FIELD_ROOT_REQUEST", "customfield_11306")
+        self.field_parent_link = os.getenv("FIELD_PARENT_LINK", "customfield_11301")
+        
+        # HTTP Connection Pool
+        self.pool_connections = int(os.getenv("JIRA_POOL_CONNECTIONS", "4"))
+        self.pool_maxsize = int(os.getenv("JIRA_POOL_MAXSIZE", "10"))
+        self.pool_block = os.getenv("JIRA_POOL_BLOCK", "False").lower() == "true"
+        self.keep_alive = os.getenv("JIRA_KEEP_ALIVE", "True").lower() == "true"
+        self.gzip = os.getenv("JIRA_GZIP", "True").lower() == "true"
+        self.request_timeout = float(os.getenv("JIRA_TIMEOUT", "30"))
+
+        # Retries and client-side rate limiting (requests/second, 0 = unlimited)
+        self.max_retries = int(os.getenv("JIRA_MAX_RETRIES", "5"))
+        self.backoff_base = float(os.getenv("JIRA_BACKOFF_BASE", "0.5"))
+        self.backoff_max = float(os.getenv("JIRA_BACKOFF_MAX", "30"))
+        self.rate_limit = float(os.getenv("JIRA_RATE_LIMIT", "0"))
+        self.rate_burst = float(os.getenv("JIRA_RATE_BURST", "0")) or None
+
+        # Local issue cache for incremental search sync
+        self.cache_dir = os.path.expanduser(os.getenv("JIRA_CACHE_DIR", "~/.cache/terminal-jira"))
+        self.issue_cache = os.getenv("JIRA_ISSUE_CACHE", "True").lower() == "true"
+
+        # Persistent epic/issue summary cache
+        self.summary_cache = os.getenv("JIRA_SUMMARY_CACHE", "True").lower() == "true"
+        self.summary_ttl = int(os.getenv("JIRA_SUMMARY_TTL", "86400"))
+        self.summary_max_entries = int(os.getenv("JIRA_SUMMARY_MAX_ENTRIES", "5000"))
+
+        # Aggregation backend for --group-by: "python" or "pandas"
+        self.group_backend = os.getenv("JIRA_GROUP_BACKEND", "python").lower()
+
+        # Concurrent page fetches for search (keep <= JIRA_POOL_MAXSIZE)
+        self.parallel = int(os.getenv("JIRA_PARALLEL", "4"))
+
+        # Long-lived `shell` / `daemon` sessions
+        self.daemon_socket = os.path.expanduser(os.getenv("JIRA_DAEMON_SOCKET", "")) or os.path.join(self.cache_dir, "daemon.sock")
+        self.daemon_idle_timeout = int(os.getenv("JIRA_DAEMON_IDLE_TIMEOUT", "3600"))
+        # Seconds a synced search stays fresh enough to answer from the issue cache within a session
+        self.session_freshness = int(os.getenv("JIRA_SESSION_FRESHNESS", "30"))
+
+        # Anonymization
+        self.anonymize = os.getenv("JIRA_ANONYMIZE", "False").lower() == "true"
+
+    def validate(self):
+        if not self.jira_url or not self.username or not self.password:
+            console.print("[red]Error: Missing configuration. Please check your .env file.[/red]")
+            console.print("Ensure JIRA_URL, JIRA_USERNAME, and JIRA_PASSWORD are set.")
+            sys.exit(1)
+
+def split_order_by(jql):
+    """
+    Splits a JQL string into its filter part and its ORDER BY clause (with leading space).
+    """
+    match = re.search(r"\s+ORDER\s+BY\s+.*$", jql, flags=re.IGNORECASE | re.DOTALL)
+    if not match:
+        return jql.strip(), ""
+    return jql[:match.start()].strip(), " " + match.group(0).strip()
+
+def jql_timestamp(updated):
+    """
+    Converts a Jira `updated` value (2024-01-31T10:15:00.000+0100) to a JQL date literal.
+    JQL only has minute precision, so the result is rounded down and re-fetches the boundary minute.
+    """
+    return datetime.strptime(updated[:16], "%Y-%m-%dT%H:%M").strftime("%Y/%m/%d %H:%M")
+
+class IssueCache:
+    """
+    SQLite store of raw issues keyed by issue key, plus the key list and sync watermark per JQL.
+    """
+    def __init__(self, path):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                key TEXT PRIMARY KEY,
+                updated TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS queries (
+                jql TEXT PRIMARY KEY,
+                keys TEXT NOT NULL,
+                last_updated TEXT,
+                fetch_limit INTEGER NOT NULL,
+                synced_at TEXT NOT NULL,
+                fields TEXT
+            );
+        """)
+        # Caches created before field projection lack the fields column
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(queries)")]
+        if "fields" not in columns:
+            self.conn.execute("ALTER TABLE queries ADD COLUMN fields TEXT")
+
+    def add_issues(self, issues):
+        with self.conn:
+            self._upsert_issues(issues)
+
+    def save_query(self, jql, keys, last_updated, fetch_limit, fields):
+        with self.conn:
+            self._save_query(jql, keys, last_updated, fetch_limit, fields)
+
+    def _upsert_issues(self, issues):
+        # Queries may fetch different field sets, so merge into what is already stored
+        existing = {}
+        keys = [i.get("key") for i in issues]
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, data in self.conn.execute(f"SELECT key, data FROM issues WHERE key IN ({placeholders})", chunk):
+                existing[key] = json_loads(data)
+        rows = []
+        for issue in issues:
+            old = existing.get(issue.get("key"))
+            if old:
+                issue = {**old, **issue, "fields": {**old.get("fields", {}), **issue.get("fields", {})}}
+            rows.append((issue.get("key"), issue.get("fields", {}).get("updated"), json.dumps(issue)))
+        self.conn.executemany("INSERT OR REPLACE INTO issues (key, updated, data) VALUES (?, ?, ?)", rows)
+
+    def _save_query(self, jql, keys, last_updated, fetch_limit, fields):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO queries (jql, keys, last_updated, fetch_limit, synced_at, fields) VALUES (?, ?, ?, ?, ?, ?)",
+            (jql, json.dumps(keys), last_updated, fetch_limit, datetime.now().isoformat(timespec="seconds"), json.dumps(fields))
+        )
+
+    @staticmethod
+    def max_updated(issues, current=None):
+        stamps = [i.get("fields", {}).get("updated") for i in issues]
+        stamps = [s for s in stamps if s] + ([current] if current else [])
+        return max(stamps, default=None)
+
+    def get_query(self, jql):
+        row = self.conn.execute(
+            "SELECT keys, last_updated, fetch_limit, fields, synced_at FROM queries WHERE jql = ?", (jql,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "keys": json.loads(row[0]), "last_updated": row[1], "fetch_limit": row[2],
+            "fields": json.loads(row[3]) if row[3] else [], "synced_at": row[4]
+        }
+
+    def get_issues(self, keys):
+        return [issue for page in self.iter_issue_pages(keys) for issue in page]
+
+    def get_updated(self, keys):
+        """
+        Returns {key: stored `updated` value} for the cached issues among keys.
+        """
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self.conn.execute(f"SELECT key, updated FROM issues WHERE key IN ({placeholders})", chunk))
+        return found
+
+    def iter_issue_pages(self, keys, page_size=PAGE_SIZE):
+        """
+        Yields cached issues for keys in order, one page at a time.
+        """
+        for start in range(0, len(keys), page_size):
+            chunk = keys[start:start + page_size]
+            placeholders = ",".join("?" * len(chunk))
+            found = {
+                key: json_loads(data)
+                for key, data in self.conn.execute(f"SELECT key, data FROM issues WHERE key IN ({placeholders})", chunk)
+            }
+            yield [found[k] for k in chunk if k in found]
+
+    def store_query(self, jql, issues, fetch_limit, fields):
+        with self.conn:
+            self._upsert_issues(issues)
+            self._save_query(jql, [i.get("key") for i in issues], self.max_updated(issues), fetch_limit, fields)
+
+    def merge_query(self, jql, keys, changed, fetch_limit):
+        """
+        Applies a delta sync: upserts changed issues and stores the query's current key list.
+        """
+        entry = self.get_query(jql)
+        with self.conn:
+            self._upsert_issues(changed)
+            self._save_query(jql, keys, self.max_updated(changed, entry["last_updated"]), fetch_limit, entry["fields"])
+        return self.get_query(jql)
+
+    def stats(self):
+        issues = self.conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+        queries = self.conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0]
+        return {"issues": issues, "queries": queries}
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM issues")
+            self.conn.execute("DELETE FROM queries")
+
+    def close(self):
+        self.conn.close()
+
+class SummaryCache:
+    """
+    Disk-backed issue key -> summary cache with a TTL and LRU eviction past max_entries.
+    Only successful lookups are persisted; failures stay in the per-run epic_cache.
+    """
+    def __init__(self, path, ttl=86400, max_entries=5000):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.conn.commit()
+
+    def get_many(self, keys):
+        """
+        Returns {key: summary} for the fresh entries among keys and marks them as recently used.
+        """
+        keys = list(keys)
+        now = time.time()
+        found = {}
+        with self.lock, self.conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key, summary FROM summaries WHERE key IN ({placeholders}) AND fetched_at >= ?",
+                    chunk + [now - self.ttl]
+                )
+                found.update(rows)
+            self.conn.executemany(
+                "UPDATE summaries SET accessed_at = ?, hits = hits + 1 WHERE key = ?",
+                [(now, key) for key in found]
+            )
+        return found
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def put_many(self, summaries):
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO summaries (key, summary, fetched_at, accessed_at, hits) VALUES (?, ?, ?, ?, 0)",
+                [(key, summary, now, now) for key, summary in summaries.items()]
+            )
+            # Evict least recently used entries beyond the size cap
+            self.conn.execute(
+                "DELETE FROM summaries WHERE key IN ("
+                "SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def put(self, key, summary):
+        self.put_many({key: summary})
+
+    def stats(self):
+        now = time.time()
+        with self.lock:
+            total, fresh, hits = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(fetched_at >= ?), 0), COALESCE(SUM(hits), 0) FROM summaries",
+                (now - self.ttl,)
+            ).fetchone()
+        return {"entries": total, "fresh": fresh, "expired": total - fresh, "hits": hits}
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM summaries")
+
+    def close(self):
+        self.conn.close()
+
+class SprintIndex:
+    """
+    JSON file mapping sprint names to IDs for the configured boards, refreshed after ttl seconds.
+    """
+    def __init__(self, path, board_ids, ttl=3600):
+        self.path = path
+        self.board_ids = sorted(board_ids)
+        self.ttl = ttl
+        self.sprints = {}
+        self.fetched_at = 0.0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        # An index built for other boards is stale
+        if data.get("board_ids") == self.board_ids:
+            self.sprints = data.get("sprints", {})
+            self.fetched_at = data.get("fetched_at", 0.0)
+
+    def is_fresh(self):
+        return bool(self.sprints) and time.time() - self.fetched_at < self.ttl
+
+    def update(self, sprints):
+        self.sprints = sprints
+        self.fetched_at = time.time()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"board_ids": self.board_ids, "fetched_at": self.fetched_at, "sprints": sprints}, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, name):
+        return self.sprints.get(name)
+
+class JiraClient:
+    """
+    Handles interactions with the Jira API.
+    """
+    def __init__(self, config, summary_cache=None):
+        self.config = config
+        self.auth = HTTPBasicAuth(self.config.username, self.config.password)
+        self.headers = {"Accept": "application/json"}
+        self.epic_cache = {}
+        self.summary_cache = summary_cache
+        self.sprint_index = None
+        self.session = self._build_session()
+        self.rate_limiter = TokenBucket(self.config.rate_limit, self.config.rate_burst)
+
+    def _build_session(self):
+        """
+        Builds the pooled keep-alive session every request goes through.
+        """
+        session = requests.Session()
+        session.auth = self.auth
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate" if self.config.gzip else "identity"
+        session.headers["Connection"] = "keep-alive" if self.config.keep_alive else "close"
+        return session
+
+    def _request(self, method, url, **kwargs):
+        """
+        Sends every Jira request: waits for the client-side rate limiter, then retries
+        throttling (429), transient 5xx answers and connection errors with exponential
+        backoff and full jitter, honouring Retry-After up to JIRA_BACKOFF_MAX; a longer
+        Retry-After returns the response instead of stalling the worker.
+        POSTs are only retried on 429, since other failures may have created the issue.
+        """
+        kwargs.setdefault("headers", self.headers)
+        kwargs.setdefault("timeout", self.config.request_timeout)
+        send = getattr(self.session, method.lower())
+        idempotent = method.upper() != "POST"
+        max_retries = self.config.max_retries
+
+        endpoint = endpoint_label(method, url)
+
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = send(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                metrics.record_request(endpoint, "error", time.perf_counter() - start, retry=attempt > 0)
+                if not idempotent or attempt == max_retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            status = response.status_code
+            metrics.record_request(endpoint, status, time.perf_counter() - start, response_size(response), retry=attempt > 0)
+            retryable = status == 429 or (idempotent and status in RETRY_STATUSES)
+            if not retryable or attempt == max_retries:
+                return response
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is not None and delay > self.config.backoff_max:
+                return response
+            time.sleep(delay if delay is not None else self._backoff(attempt))
+        return response
+
+    def _backoff(self, attempt):
+        cap = min(self.config.backoff_max, self.config.backoff_base * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def connection_stats(self):
+        """
+        Returns how many TCP connections were opened vs reused by the pool.
+        """
+        opened = 0
+        requests_made = 0
+        for adapter in set(self.session.adapters.values()):
+            for key in list(adapter.poolmanager.pools.keys()):
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                requests_made += pool.num_requests
+        return {
+            "requests": requests_made,
+            "opened": opened,
+            "reused": max(requests_made - opened, 0),
+        }
+
+    def close(self):
+        self.session.close()
+
+    def get_epic_summary(self, epic_link):
+        if not epic_link:
+            return ""
+        if epic_link in self.epic_cache:
+            metrics.record_cache("epic_memory", hits=1)
+            return self.epic_cache[epic_link]
+        metrics.record_cache("epic_memory", misses=1)
+        if self.summary_cache:
+            cached = self.summary_cache.get(epic_link)
+            metrics.record_cache("summary_cache", hits=int(cached is not None), misses=int(cached is None))
+            if cached is not None:
+                self.epic_cache[epic_link] = cached
+                return cached
+
+        url = f"{self.config.jira_url}{self.config.endpoint_issue}/{epic_link}"
+        try:
+            response = self._request("GET", url)
+            if response.status_code == 200:
+                summary = response.json().get("fields", {}).get("summary", "Unknown")
+                self.epic_cache[epic_link] = summary
+                if self.summary_cache:
+                    self.summary_cache.put(epic_link, summary)
+                return summary
+        except Exception:
+            pass
+        # Cache the failure too, so one broken epic is not retried on every row
+        self.epic_cache[epic_link] = "Error"
+        return "Error"
+
+    def resolve_epic_summaries(self, epic_links, parallel=None, show_progress=True):
+        """
+        Resolves many epic summaries with chunked `key in (...)` searches.
+        Fills epic_cache, storing "Error" for keys Jira did not return.
+        """
+        pending = self._pending_epics(epic_links)
+        if not pending:
+            return self.epic_cache
+
+        parallel = max(1, parallel or self.config.parallel)
+        chunks = [pending[i:i + PAGE_SIZE] for i in range(0, len(pending), PAGE_SIZE)]
+
+        def fetch(chunk):
+            try:
+                return self._fetch_epic_chunk(chunk)
+            except (JiraAPIError, requests.exceptions.RequestException):
+                return {}
+
+        from rich.progress import Progress
+
+        with Progress(disable=not show_progress) as progress:
+            task = progress.add_task("[cyan]Fetching Epic details...", total=len(pending))
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for chunk, found in zip(chunks, executor.map(fetch, chunks)):
+                    self._store_epic_chunk(chunk, found)
+                    progress.advance(task, len(chunk))
+
+        return self.epic_cache
+
+    def forget_failed_epics(self):
+        """
+        Drops "Error" entries from epic_cache so the next lookup asks Jira again.
+        """
+        for key in [key for key, summary in self.epic_cache.items() if summary == "Error"]:
+            del self.epic_cache[key]
+
+    def _pending_epics(self, epic_links):
+        """
+        Returns the sorted distinct epic keys found in neither the in-memory nor the on-disk cache.
+        """
+        links = {link for link in epic_links if link}
+        pending = sorted(link for link in links if link not in self.epic_cache)
+        metrics.record_cache("epic_memory", hits=len(links) - len(pending), misses=len(pending))
+        if pending and self.summary_cache:
+            found = self.summary_cache.get_many(pending)
+            metrics.record_cache("summary_cache", hits=len(found), misses=len(pending) - len(found))
+            self.epic_cache.update(found)
+            pending = [link for link in pending if link not in self.epic_cache]
+        return pending
+
+    def _fetch_epic_chunk(self, chunk):
+        """
+        Looks up the summaries of up to PAGE_SIZE epics with one `key in (...)` search.
+        """
+        url = f"{self.config.jira_url}{self.config.endpoint_search}"
+        keys = ",".join(f'"{key}"' for key in chunk)
+        data = self._search_page(
+            url, f"key in ({keys})", 0, len(chunk), "summary",
+            extra_params={"validateQuery": "false"}
+        )
+        return {i.get("key"): i.get("fields", {}).get("summary", "Unknown") for i in data.get("issues", [])}
+
+    def _store_epic_chunk(self, chunk, found):
+        for key in chunk:
+            self.epic_cache[key] = found.get(key, "Error")
+        if found and self.summary_cache:
+            self.summary_cache.put_many(found)
+
+    def create_issue(self, fields):
+        url = f"{self.config.jira_url}{self.config.endpoint_issue}"
+        try:
+            response = self._request("POST", url, json={"fields": fields})
+            if response.status_code in (201, 200):
+                return response.json()
+            else:
+                console.print(f"[red]Error creating issue: {response.status_code}[/red]")
+                console.print(f"[red]{response.text}[/red]")
+                return None
+        except Exception as e:
+            console.print(f"[red]Connection Error: {e}[/red]")
+            return None
+
+    def _create_issue_chunk(self, chunk):
+        """
+        Posts up to BULK_CHUNK_SIZE field dicts to the bulk endpoint.
+        Returns one (key, error) pair per element, in input order.
+        """
+        url = f"{self.config.jira_url}{self.config.endpoint_issue}/bulk"
+        try:
+            response = self._request("POST", url, json={"issueUpdates": [{"fields": fields} for fields in chunk]})
+        except requests.exceptions.RequestException as e:
+            return [(None, f"Connection Error: {e}")] * len(chunk)
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if response.status_code not in (201, 200, 400) or not isinstance(data, dict):
+            return [(None, f"HTTP {response.status_code}: {response.text}")] * len(chunk)
+
+        failed = {}
+        for error in data.get("errors", []):
+            element = error.get("elementErrors", {})
+            messages = list(element.get("errorMessages", []))
+            messages += [f"{field}: {msg}" for field, msg in element.get("errors", {}).items()]
+            failed[error.get("failedElementNumber")] = "; ".join(messages) or f"HTTP {error.get('status')}"
+
+        # Created issues are listed in order for the elements that did not fail
+        created = iter(data.get("issues", []))
+        results = []
+        for index in range(len(chunk)):
+            if index in failed:
+                results.append((None, failed[index]))
+            else:
+                issue = next(created, None)
+                results.append((issue.get("key"), None) if issue else (None, "Missing from bulk response"))
+        return results
+
+    def create_issues_bulk(self, field_list, parallel=None):
+        """
+        Creates many issues through the bulk endpoint, BULK_CHUNK_SIZE per request, chunks in parallel.
+        Returns one (key, error) pair per input, in order.
+        """
+        parallel = max(1, parallel or self.config.parallel)
+        chunks = [field_list[i:i + BULK_CHUNK_SIZE] for i in range(0, len(field_list), BULK_CHUNK_SIZE)]
+
+        from rich.progress import Progress
+
+        results = []
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Creating issues...", total=len(field_list))
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for chunk_results in executor.map(self._create_issue_chunk, chunks):
+                    results.extend(chunk_results)
+                    progress.advance(task, len(chunk_results))
+        return results
+
+    def _put_issue(self, key, fields):
+        """
+        Updates one issue. Returns None on success or an error message.
+        """
+        url = f"{self.config.jira_url}{self.config.endpoint_issue}/{key}"
+        try:
+            response = self._request("PUT", url, json={"fields": fields})
+        except requests.exceptions.RequestException as e:
+            return f"Connection Error: {e}"
+        if response.status_code in (204, 200):
+            return None
+        return f"HTTP {response.status_code}: {response.text}"
+
+    def edit_issues_bulk(self, keys, fields, parallel=None):
+        """
+        Applies the same field update to many issues with a bounded pool of concurrent PUTs.
+        Returns one (key, error) pair per key, in order; error is None on success.
+        """
+        parallel = max(1, parallel or self.config.parallel)
+
+        from rich.progress import Progress
+
+        results = []
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Updating issues...", total=len(keys))
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for key, error in zip(keys, executor.map(lambda k: self._put_issue(k, fields), keys)):
+                    results.append((key, error))
+                    progress.advance(task)
+        return results
+
+    def edit_issue(self, key, fields):
+        url = f"{self.config.jira_url}{self.config.endpoint_issue}/{key}"
+        try:
+            response = self._request("PUT", url, json={"fields": fields})
+            if response.status_code in (204, 200):
+                return True
+            else:
+                console.print(f"[red]Error editing issue: {response.status_code}[/red]")
+                console.print(f"[red]{response.text}[/red]")
+                return False
+        except Exception as e:
+            console.print(f"[red]Connection Error: {e}[/red]")
+            return False
+
+    def get_issue(self, key):
+        issue, error = self._fetch_issue(key)
+        if error:
+            console.print(f"[red]{error}[/red]")
+        return issue
+
+    def _fetch_issue(self, key):
+        """
+        Fetches one issue. Returns (issue, None) or (None, error message).
+        """
+        url = f"{self.config.jira_url}{self.config.endpoint_issue}/{key}"
+        try:
+            response = self._request("GET", url)
+            if response.status_code == 200:
+                return response.json(), None
+            return None, f"Error fetching issue: {response.status_code}"
+        except Exception as e:
+            return None, f"Connection Error: {e}"
+
+    def detail_fields(self):
+        """
+        Jira fields shown by `view`.
+        """
+        return [
+            "key", "summary", "description", "issuetype", "status", "priority", "assignee", "fixVersions", "project",
+            self.config.field_story_points, self.config.field_epic_link,
+        ]
+
+    def get_issues(self, keys, fields=None, parallel=None):
+        """
+        Fetches many issues by key with chunked `key in (...)` searches (one request per PAGE_SIZE keys).
+        Falls back to concurrent single-issue GETs when the search is rejected.
+        Returns {key: issue} for the keys Jira returned; keys are matched case-insensitively.
+        """
+        keys = list(dict.fromkeys(key.upper() for key in keys))
+        url = f"{self.config.jira_url}{self.config.endpoint_search}"
+        fields_param = ",".join(fields or self.detail_fields())
+        parallel = max(1, parallel or self.config.parallel)
+        chunks = [keys[i:i + PAGE_SIZE] for i in range(0, len(keys), PAGE_SIZE)]
+
+        def search(chunk):
+            jql = "key in ({})".format(",".join(f'"{key}"' for key in chunk))
+            # validateQuery=false turns unknown keys into warnings instead of failing the search
+            return self._search_page(url, jql, 0, len(chunk), fields_param, extra_params={"validateQuery": "false"})
+
+        found = {}
+        try:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for data in executor.map(search, chunks):
+                    found.update((issue.get("key"), issue) for issue in data.get("issues", []))
+            return found
+        except JiraAPIError:
+            pass
+
+        # Some Jira versions still reject the whole search over one unknown or hidden key
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            for key, (issue, _) in zip(keys, executor.map(self._fetch_issue, keys)):
+                if issue:
+                    found[issue.get("key", key)] = issue
+        return found
+
+    def fetch_board_sprints(self, board_id):
+        """
+        Lists every sprint (future, active and closed) of a board via the Agile API.
+        Returns {name: id}. Raises JiraAPIError on a non-200 response.
+        """
+        url = f"{self.config.jira_url}{self.config.endpoint_agile}/board/{board_id}/sprint"
+        sprints = {}
+        start_at = 0
+        while True:
+            response = self._request("GET", url, params={"startAt": start_at, "maxResults": 50})
+            if response.status_code != 200:
+                raise JiraAPIError(response.status_code, response.text)
+            data = json_loads(response.content)
+            values = data.get("values", [])
+            for sprint in values:
+                sprints[sprint.get("name")] = sprint.get("id")
+            start_at += len(values)
+            if data.get("isLast", True) or not values:
+                return sprints
+
+    def refresh_sprint_index(self):
+        sprints = {}
+        for board_id in self.config.board_ids:
+            sprints.update(self.fetch_board_sprints(board_id))
+        self.sprint_index.update(sprints)
+
+    def _lookup_sprint_index(self, sprint_name):
+        if self.sprint_index is None:
+            self.sprint_index = SprintIndex(
+                os.path.join(self.config.cache_dir, "sprints.json"), self.config.board_ids, ttl=self.config.sprint_ttl
+            )
+        refreshed = False
+        if not self.sprint_index.is_fresh():
+            self.refresh_sprint_index()
+            refreshed = True
+        sprint_id = self.sprint_index.get(sprint_name)
+        metrics.record_cache("sprint_index", hits=int(sprint_id is not None and not refreshed),
+                             misses=int(sprint_id is None or refreshed))
+        # A miss on a cached index may just be a sprint created since the last refresh
+        if sprint_id is None and not refreshed:
+            self.refresh_sprint_index()
+            sprint_id = self.sprint_index.get(sprint_name)
+        return sprint_id
+
+    def get_sprint_id(self, sprint_name):
+        """
+        Resolves a sprint name to its ID. Uses the board sprint index when JIRA_BOARD_IDS is set,
+        otherwise (or on a miss) searches for an issue in that sprint, which fails for empty sprints.
+        """
+        if self.config.board_ids:
+            try:
+                sprint_id = self._lookup_sprint_index(sprint_name)
+                if sprint_id is not None:
+                    return int(sprint_id)
+            except (JiraAPIError, requests.exceptions.RequestException) as e:
+                console.print(f"[yellow]Could not load sprints from boards: {e}. Falling back to search.[/yellow]")
+
+        jql = f'sprint = "{sprint_name}"'
+        issues = self.search_issues(jql, limit=1)
+        
+        if not issues:
+            console.print(f"[yellow]Could not find any issues in sprint '{sprint_name}'. Cannot resolve ID if sprint is empty.[/yellow]")
+            return None
+            
+        # Get sprint field from first issue
+        sprints = issues[0]["fields"].get(self.config.field_sprints)
+        if not sprints:
+            return None
+            
+        for spr in sprints:
+            sprint = decode_sprint(spr)
+            if sprint.name == sprint_name and sprint.id is not None:
+                return sprint.id
+        return None
+
+    def _search_page(self, url, jql, start_at, max_results, fields_param, extra_params=None):
+        """
+        Fetches one page of search results. Raises JiraAPIError on a non-200 response.
+        """
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": fields_param
+        }
+        if extra_params:
+            params.update(extra_params)
+        response = self._request("GET", url, params=params)
+        if response.status_code != 200:
+            raise JiraAPIError(response.status_code, response.text)
+        # Decode the raw body; response.json() would build a str copy of it first
+        return json_loads(response.content)
+
+    def search_issues(self, jql, limit=100, parallel=None, fields=None, show_progress=True, on_total=None):
+        return [
+            issue
+            for page in self.iter_search_pages(jql, limit, parallel, fields, show_progress, on_total=on_total)
+            for issue in page
+        ]
+
+    def fetch_changes(self, jql, since, fields=None, known_keys=(), parallel=None, show_progress=True):
+        """
+        Returns (every issue matching jql updated since `since`, oldest first, and the keys among
+        `known_keys` updated since then that no longer match). `since` is a Jira `updated` value;
+        the minute it falls in is fetched again.
+        """
+        where, _ = split_order_by(jql)
+        since = jql_timestamp(since)
+
+        # Paged to the end, oldest first: a watermark taken from the result never skips a change
+        delta = self.search_issues(f"({where}) AND updated >= \"{since}\" ORDER BY updated ASC", limit=sys.maxsize,
+                                   parallel=parallel, fields=fields, show_progress=show_progress)
+        if not known_keys:
+            return delta, set()
+
+        # Also paged to the end, keys only, so churn elsewhere in the instance cannot push a removal out
+        left = self.search_issues(f"updated >= \"{since}\" AND NOT ({where})", limit=sys.maxsize, parallel=parallel,
+                                  fields=["key"], show_progress=show_progress)
+        known = set(known_keys)
+        return delta, {issue.get("key") for issue in left if issue.get("key") in known}
+
+    def default_search_fields(self):
+        """
+        Jira fields behind every IssueRecord column.
+        """
+        return self.fields_for_columns(None)
+
+    def fields_for_columns(self, columns):
+        """
+        Maps IssueRecord column labels to the Jira fields needed to fill them; None means all columns.
+        """
+        mapping = {
+            "Type": ["issuetype"],
+            "Summary": ["summary"],
+            "Status": ["status"],
+            "Priority": ["priority"],
+            "Assignee": ["assignee"],
+            "Sprint": [self.config.field_sprints],
+            "Points": [self.config.field_story_points],
+            "Epic Link": [self.config.field_epic_link],
+            "Epic Summary": [self.config.field_epic_link],
+            "Created": ["created"],
+            "Updated": ["updated"],
+        }
+        fields = ["key"]
+        for label, jira_fields in mapping.items():
+            if columns is None or label in columns:
+                fields.extend(f for f in jira_fields if f not in fields)
+        return fields
+
+    def iter_search_pages(self, jql, limit=100, parallel=None, fields=None, show_progress=True, start_at=0,
+                          on_total=None):
+        """
+        Yields up to `limit` search results starting at `start_at`, one page at a time, in JQL order.
+        At most `parallel` pages are in flight or buffered, so memory is bounded by page size.
+        `on_total` is called with the match count Jira reports on the first page (None if it reports none).
+        """
+        url = f"{self.config.jira_url}{self.config.endpoint_search}"
+        parallel = max(1, parallel or self.config.parallel)
+        fetched = 0
+        
+        # Fields to fetch
+        if fields is None:
+            fields = self.default_search_fields()
+        
+        fields_param = ",".join(fields)
+
+        from rich.progress import Progress
+
+        with Progress(disable=not show_progress) as progress:
+            task = progress.add_task("[cyan]Fetching issues...", total=None)
+
+            try:
+                # The first page tells us the total, so the rest can be fetched concurrently
+                page_size = min(limit, PAGE_SIZE)
+                data = self._search_page(url, jql, start_at, page_size, fields_param)
+                issues = data.get("issues", [])[:limit]
+                fetched += len(issues)
+                progress.update(task, completed=fetched)
+                total = data.get("total")
+                if on_total:
+                    on_total(total)
+                yield issues
+
+                if len(issues) < page_size or fetched >= limit:
+                    return
+
+                if total is not None:
+                    target = min(total, start_at + limit)
+                    progress.update(task, total=target - start_at)
+                    offsets = iter(range(start_at + fetched, target, page_size))
+                    with ThreadPoolExecutor(max_workers=parallel) as executor:
+                        def submit_next():
+                            start = next(offsets, None)
+                            if start is not None:
+                                pending.append(executor.submit(
+                                    self._search_page, url, jql, start, min(page_size, target - start), fields_param
+                                ))
+
+                        pending = deque()
+                        for _ in range(parallel):
+                            submit_next()
+                        # Consume in submission order so results stay sorted like the JQL
+                        while pending:
+                            issues = pending.popleft().result().get("issues", [])[:limit - fetched]
+                            submit_next()
+                            fetched += len(issues)
+                            progress.update(task, completed=fetched)
+                            yield issues
+                    return
+
+                # No total reported: fall back to walking startAt one page at a time
+                start_at += fetched
+                while True:
+                    max_results = min(limit - fetched, PAGE_SIZE)
+                    data = self._search_page(url, jql, start_at, max_results, fields_param)
+                    issues = data.get("issues", [])
+                    fetched += len(issues)
+                    progress.update(task, completed=fetched)
+                    yield issues
+
+                    if len(issues) < max_results or fetched >= limit:
+                        break
+                    start_at += len(issues)
+
+            except JiraAPIError as e:
+                progress.stop()
+                console.print(f"[red]Error fetching issues: {e.status_code}[/red]")
+                console.print(f"[red]{e.text}[/red]")
+                sys.exit(1)
+            except requests.exceptions.RequestException as e:
+                progress.stop()
+                console.print(f"[red]Connection error: {e}[/red]")
+                sys.exit(1)
+
+    def sync_issues(self, jql, cache, limit=100, parallel=None, offline=False, refresh=False, fields=None, max_age=None):
+        return [
+            issue
+            for page in self.iter_sync_pages(jql, cache, limit, parallel, offline, refresh, fields=fields, max_age=max_age)
+            for issue in page
+        ]
+
+    def iter_sync_pages(self, jql, cache, limit=100, parallel=None, offline=False, refresh=False, show_progress=True,
+                        fields=None, max_age=None):
+        """
+        Answers a search from the on-disk cache, fetching only what changed since the last sync.
+        A query synced less than `max_age` seconds ago is answered from the cache without any request.
+        Yields pages like iter_search_pages.
+        """
+        entry = cache.get_query(jql)
+        # The watermark needs `updated`; a query keeps the union of every field set it was asked for
+        fields = list(fields or self.default_search_fields())
+        if "updated" not in fields:
+            fields.append("updated")
+
+        if offline:
+            if entry is None:
+                console.print("[red]Error: No cached results for this JQL. Run it once online first.[/red]")
+                sys.exit(1)
+            missing = [f for f in fields if f not in entry["fields"]]
+            if missing:
+                console.print(f"[red]Error: The cached results for this JQL lack the fields {', '.join(missing)}. "
+                              f"Run this report once online first.[/red]")
+                sys.exit(1)
+            metrics.record_cache("issue_cache", hits=len(entry["keys"][:limit]))
+            yield from cache.iter_issue_pages(entry["keys"][:limit])
+            return
+
+        # A previous sync that hit its limit cannot answer a larger request
+        truncated = entry is not None and len(entry["keys"]) >= entry["fetch_limit"] and limit > entry["fetch_limit"]
+        # Cached issues for this query lack some requested fields
+        missing_fields = entry is not None and not set(fields) <= set(entry["fields"])
+        full_sync = entry is None or refresh or truncated or missing_fields or not entry["last_updated"]
+        # Inside a shell/daemon session, a query synced moments ago is answered without any request
+        if not full_sync and max_age and (datetime.now() - datetime.fromisoformat(entry["synced_at"])).total_seconds() < max_age:
+            metrics.record_cache("issue_cache", hits=len(entry["keys"][:limit]))
+            yield from cache.iter_issue_pages(entry["keys"][:limit])
+            return
+
+        if full_sync:
+            if entry is not None:
+                fields += [f for f in entry["fields"] if f not in fields]
+            keys = []
+            last_updated = None
+            for page in self.iter_search_pages(jql, limit=limit, parallel=parallel, fields=fields, show_progress=show_progress):
+                cache.add_issues(page)
+                keys.extend(i.get("key") for i in page)
+                last_updated = cache.max_updated(page, last_updated)
+                metrics.record_cache("issue_cache", misses=len(page))
+                yield page
+            cache.save_query(jql, keys, last_updated, limit, fields)
+            return
+
+        # Membership and order come from re-running the query for keys and `updated` only, so new
+        # matches, removals and ORDER BY moves are exact; full data is fetched only for issues that
+        # changed since they were cached or are new to this query
+        listing = self.search_issues(jql, limit=limit, parallel=parallel, fields=["key", "updated"], show_progress=show_progress)
+        keys = [issue.get("key") for issue in listing]
+        known = set(entry["keys"])
+        cached = cache.get_updated(keys)
+        stale = [
+            issue.get("key") for issue in listing
+            if issue.get("key") not in known or cached.get(issue.get("key")) != issue.get("fields", {}).get("updated")
+        ]
+        changed = []
+        if stale:
+            found = self.get_issues(stale, fields=entry["fields"], parallel=parallel)
+            changed = list(found.values())
+            # Issues deleted between the two requests
+            missing = set(stale) - set(found)
+            keys = [key for key in keys if key not in missing]
+
+        cache.merge_query(jql, keys, changed, limit)
+        metrics.record_cache("issue_cache", hits=len(keys) - len(changed), misses=len(changed))
+        yield from cache.iter_issue_pages(keys)
+
+SprintInfo = namedtuple("SprintInfo", ["id", "name", "state", "start_date", "end_date", "complete_date"])
+
+# Splits "id=1,name=Sprint 1, Team A,state=ACTIVE" only at commas that start a new key=value pair
+_SPRINT_FIELD_SPLIT = re.compile(r",(?=[A-Za-z]+=)")
+_SPRINT_BODY = re.compile(r"\[(.*)\]\s*$", re.DOTALL)
+
+def decode_sprint(raw):
+    """
+    Decodes one sprint value into a SprintInfo.
+    Accepts the legacy greenhopper string ("...Sprint@1a2b[id=1,name=Sprint 1,...]") and the
+    object form returned by newer Jira versions.
+    """
+    if isinstance(raw, dict):
+        sprint_id = raw.get("id")
+        return SprintInfo(
+            int(sprint_id) if sprint_id is not None else None,
+            raw.get("name"),
+            raw.get("state"),
+            raw.get("startDate"),
+            raw.get("endDate"),
+            raw.get("completeDate"),
+        )
+    return _decode_sprint_string(str(raw))
+
+@lru_cache(maxsize=4096)
+def _decode_sprint_string(raw):
+    # A project has a few dozen distinct sprint strings, so each one is parsed once
+    match = _SPRINT_BODY.search(raw)
+    body = match.group(1) if match else raw
+    values = {}
+    for part in _SPRINT_FIELD_SPLIT.split(body):
+        name, sep, value = part.partition("=")
+        if sep:
+            values[name.strip()] = None if value == "<null>" else value
+    sprint_id = values.get("id")
+    return SprintInfo(
+        int(sprint_id) if sprint_id and sprint_id.isdigit() else None,
+        values.get("name"),
+        values.get("state"),
+        values.get("startDate"),
+        values.get("endDate"),
+        values.get("completeDate"),
+    )
+
+class IssueRecord:
+    """
+    Compact, typed row produced by IssueParser.
+    Points are a float (None when unestimated) and repeated strings are interned.
+    Column labels ("Key", "Epic Link", ...) can be used like dict keys.
+    """
+    __slots__ = ("key", "type", "summary", "status", "priority", "assignee", "sprint", "points", "epic_link", "epic_summary",
+                 "created", "updated")
+
+    COLUMNS = {
+        "Key": "key",
+        "Type": "type",
+        "Summary": "summary",
+        "Status": "status",
+        "Priority": "priority",
+        "Assignee": "assignee",
+        "Sprint": "sprint",
+        "Points": "points",
+        "Epic Link": "epic_link",
+        "Epic Summary": "epic_summary",
+    }
+
+    def __init__(self, key, type=None, summary=None, status=None, priority="None", assignee="Unassigned",
+                 sprint="", points=None, epic_link="", epic_summary=None, created=None, updated=None):
+        self.key = key
+        self.type = _intern(type)
+        self.summary = summary
+        self.status = _intern(status)
+        self.priority = _intern(priority)
+        self.assignee = _intern(assignee)
+        self.sprint = _intern(sprint)
+        self.points = points
+        self.epic_link = epic_link
+        # None means epic summaries were not requested for this search
+        self.epic_summary = epic_summary
+        # Raw Jira timestamps; not table columns, but carried into columnar exports
+        self.created = created
+        self.updated = updated
+
+    def keys(self):
+        labels = list(self.COLUMNS)
+        if self.epic_summary is None:
+            labels.remove("Epic Summary")
+        return labels
+
+    def __contains__(self, label):
+        return label in self.COLUMNS and (label != "Epic Summary" or self.epic_summary is not None)
+
+    def __getitem__(self, label):
+        if label not in self:
+            raise KeyError(label)
+        return getattr(self, self.COLUMNS[label])
+
+    def __setitem__(self, label, value):
+        setattr(self, self.COLUMNS[label], value)
+
+    def get(self, label, default=None):
+        return self[label] if label in self else default
+
+    def to_dict(self):
+        return {label: self[label] for label in self.keys()}
+
+    def display(self, label):
+        """
+        Returns the string shown for a column in tables and tsv output.
+        """
+        value = self[label]
+        if value is None:
+            return ""
+        return str(value)
+
+    def __repr__(self):
+        return f"IssueRecord({self.to_dict()!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, IssueRecord) and all(
+            getattr(self, attr) == getattr(other, attr) for attr in self.__slots__
+        )
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+def parse_points(value):
+    """
+    Returns story points as a float, or None when missing or not numeric.
+    """
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+class IssueParser:
+    """
+    Parses raw Jira issue data into IssueRecord rows.
+    """
+    def __init__(self, config):
+        self.config = config
+
+    def parse(self, issues, columns=None):
+        """
+        Parses raw issues into IssueRecords. With `columns` (a set of column labels),
+        only those are extracted and the rest keep their defaults.
+        """
+        want = (lambda label: True) if columns is None else (lambda label: label in columns)
+        want_type, want_summary, want_status = want("Type"), want("Summary"), want("Status")
+        want_priority, want_assignee, want_sprint = want("Priority"), want("Assignee"), want("Sprint")
+        want_points, want_epic = want("Points"), want("Epic Link") or want("Epic Summary")
+        want_dates = want("Created") or want("Updated")
+
+        parsed_issues = []
+        for issue in issues:
+            fields = issue.get("fields", {})
+            record = IssueRecord(issue.get("key"))
+            
+            # Basic Fields
+            if want_summary:
+                record.summary = f"Redacted Summary for {record.key}" if self.config.anonymize else fields.get("summary")
+            if want_status:
+                record.status = _intern((fields.get("status") or {}).get("name"))
+            if want_assignee and fields.get("assignee"):
+                record.assignee = _intern(fields["assignee"].get("displayName"))
+            if want_priority and fields.get("priority"):
+                record.priority = _intern(fields["priority"].get("name"))
+            if want_type:
+                record.type = _intern((fields.get("issuetype") or {}).get("name"))
+            
+            # Custom Fields
+            if want_epic:
+                epic_link = fields.get(self.config.field_epic_link)
+                record.epic_link = str(epic_link) if epic_link else ""
+            if want_points:
+                record.points = parse_points(fields.get(self.config.field_story_points))
+            
+            # Sprint parsing
+            if want_sprint:
+                sprints = fields.get(self.config.field_sprints)
+                if sprints:
+                    # The last sprint in the list is the current or most recent one
+                    record.sprint = _intern(decode_sprint(sprints[-1]).name or "")
+
+            if want_dates:
+                record.created = fields.get("created")
+                record.updated = fields.get("updated")
+
+            parsed_issues.append(record)
+        return parsed_issues
+
+def sort_issues(issues, column):
+    """
+    Sorts parsed issues in place by a column label (case-insensitive).
+    Points sort numerically with unestimated issues last; other columns sort as lowercase text.
+    """
+    labels = {label.lower(): label for label in IssueRecord.COLUMNS}
+    label = labels.get(column.lower())
+    if label is None or (issues and label not in issues[0]):
+        console.print(f"[yellow]Warning: Column '{column}' not found. Displaying unsorted.[/yellow]")
+        return
+    if label == "Points":
+        issues.sort(key=lambda issue: (issue.points is None, issue.points or 0.0))
+    else:
+        attr = IssueRecord.COLUMNS[label]
+        issues.sort(key=lambda issue: str(getattr(issue, attr) or "").lower())
+
+def records_to_frame(issues):
+    """
+    Builds a pandas DataFrame column by column from IssueRecord rows, with Points as float (0 when unestimated).
+    """
+    import pandas as pd
+
+    labels = issues[0].keys() if issues else list(IssueRecord.COLUMNS)
+    df = pd.DataFrame({label: [getattr(i, IssueRecord.COLUMNS[label]) for i in issues] for label in labels})
+    df['Points'] = df['Points'].astype(float).fillna(0)
+    return df
+
+def resolve_columns(requested, available):
+    """
+    Maps requested column names case-insensitively onto available ones, warning about unknown names.
+    """
+    available_cols = {c.lower(): c for c in available}
+    valid = []
+    for col in requested:
+        col = col.strip()
+        if col.lower() in available_cols:
+            valid.append(available_cols[col.lower()])
+        else:
+            console.print(f"[yellow]Warning: Column '{col}' not found. Ignoring.[/yellow]")
+    return valid
+
+class GroupByAggregator:
+    """
+    Single-pass count / points accumulator for --group-by.
+    Issues can be added one at a time, e.g. while search pages are still arriving.
+    """
+    def __init__(self, columns):
+        self.columns = columns
+        self.groups = {}
+        attrs = [IssueRecord.COLUMNS[col] for col in columns]
+        getter = attrgetter(*attrs)
+        self._key = getter if len(attrs) > 1 else (lambda issue: (getter(issue),))
+
+    def add(self, issue):
+        key = self._key(issue)
+        # Match pandas groupby, which drops rows with a missing group key
+        if None in key:
+            return
+        acc = self.groups.get(key)
+        if acc is None:
+            acc = self.groups[key] = [0, 0.0]
+        acc[0] += 1
+        acc[1] += issue.points or 0.0
+
+    def extend(self, issues):
+        for issue in issues:
+            self.add(issue)
+
+    def remove(self, issue):
+        """
+        Takes back an issue added earlier, e.g. when a watched issue changes or leaves the result.
+        """
+        key = self._key(issue)
+        acc = self.groups.get(key)
+        if acc is None:
+            return
+        acc[0] -= 1
+        acc[1] -= issue.points or 0.0
+        if acc[0] == 0:
+            del self.groups[key]
+
+    def rows(self):
+        """
+        Returns (group values, count, total points) tuples, highest points first.
+        """
+        ordered = sorted(self.groups.items(), key=lambda item: tuple(str(v) for v in item[0]))
+        ordered.sort(key=lambda item: item[1][1], reverse=True)
+        return [(key, acc[0], acc[1]) for key, acc in ordered]
+
+def group_issues_pandas(issues, columns):
+    """
+    pandas backend for --group-by, returning the same rows as GroupByAggregator.rows().
+    """
+    df = records_to_frame(issues)
+    grouped = df.groupby(columns).agg(
+        Count=('Key', 'count'),
+        Total_Points=('Points', 'sum')
+    ).reset_index()
+    grouped = grouped.sort_values(by='Total_Points', ascending=False, kind='stable')
+    keys = zip(*(grouped[col].tolist() for col in columns))
+    return list(zip(keys, grouped['Count'].tolist(), grouped['Total_Points'].tolist()))
+
+def display_grouped(columns, groups):
+    console.print(render_grouped(columns, groups))
+
+def render_grouped(columns, groups):
+    """
+    Builds the table of group-by rows with a grand total section.
+    """
+    from rich.table import Table
+
+    table = Table(title=f"Grouped by {', '.join(columns)}")
+    for col in columns:
+        table.add_column(col, style="cyan")
+    table.add_column("Count", justify="right", style="green")
+    table.add_column("Total Points", justify="right", style="magenta")
+
+    total_count = 0
+    total_points = 0.0
+    for key, count, points in groups:
+        table.add_row(*[str(v) for v in key], str(count), f"{points:.1f}")
+        total_count += count
+        total_points += points
+
+    # Grand Totals
+    table.add_section()
+    total_row = ["Total"] + [""] * (len(columns) - 1)
+    total_row.append(str(total_count))
+    total_row.append(f"{total_points:.1f}")
+    table.add_row(*total_row)
+    return table
+
+def resolve_pivot_values(spec, avail):
+    """
+    Turns a --pivot-values spec such as "Points" or "Count,Points" into
+    (label, source column, aggregation) tuples. Points are summed; "Count"
+    counts issues; any other column counts its non-empty values.
+    """
+    values = []
+    for name in spec.split(','):
+        name = name.strip()
+        if not name:
+            continue
+        if name.lower() == "count":
+            values.append(("Count", "Key", "count"))
+            continue
+        real = avail.get(name.lower(), name)
+        values.append((real, real, "sum" if real == "Points" else "count"))
+    return values
+
+def build_pivot(issues, rows, cols, values):
+    """
+    Computes every requested value field in a single pivot_table call.
+    The result has (value label, column) pairs as columns, grouped by column.
+    """
+    import pandas as pd
+
+    df = records_to_frame(issues)
+
+    # One source column per label, so "Count" (on Key) and "Key" can coexist
+    sources = {}
+    for label, source, agg in values:
+        alias = f"__{label}"
+        df[alias] = df[source]
+        sources[alias] = agg
+
+    pivot = pd.pivot_table(
+        df, index=rows, columns=cols, values=list(sources), aggfunc=sources,
+        fill_value=0, margins=True, margins_name='Total'
+    )
+    col_labels = list(dict.fromkeys(pivot.columns.get_level_values(-1)))
+    pivot = pivot.reindex(columns=[(f"__{label}", c) for c in col_labels for label, _, _ in values])
+    pivot.columns = [(label, c) for c in col_labels for label, _, _ in values]
+    return pivot.fillna(0)
+
+class PivotAggregator:
+    """
+    Incremental counterpart of build_pivot for `search --watch`: keeps an issue count and one
+    accumulator per value field for every (row, column) cell, so issues can be added and removed
+    one at a time. frame() returns the same layout as build_pivot, margins included.
+    """
+    def __init__(self, rows, cols, values):
+        self.rows = rows
+        self.cols = cols
+        self.values = values
+        self.cells = {}
+
+    def _update(self, issue, sign):
+        cell = (issue.get(self.rows), issue.get(self.cols))
+        # Match pivot_table, which drops rows with a missing index or column value
+        if None in cell:
+            return
+        acc = self.cells.get(cell)
+        if acc is None:
+            if sign < 0:
+                return
+            acc = self.cells[cell] = [0] * (len(self.values) + 1)
+        acc[0] += sign
+        for i, (_, source, agg) in enumerate(self.values, 1):
+            value = issue.get(source)
+            if agg == "sum":
+                acc[i] += sign * (value or 0.0)
+            elif value is not None:
+                acc[i] += sign
+        if acc[0] == 0:
+            del self.cells[cell]
+
+    def add(self, issue):
+        self._update(issue, 1)
+
+    def extend(self, issues):
+        for issue in issues:
+            self._update(issue, 1)
+
+    def remove(self, issue):
+        self._update(issue, -1)
+
+    def frame(self):
+        import pandas as pd
+
+        row_labels = sorted({row for row, _ in self.cells})
+        col_labels = sorted({col for _, col in self.cells})
+        width = len(self.values)
+        row_pos = {label: i for i, label in enumerate(row_labels)}
+        col_pos = {label: i * width for i, label in enumerate(col_labels)}
+        total_row, total_col = len(row_labels), len(col_labels) * width
+
+        data = [[0.0] * (total_col + width) for _ in range(total_row + 1)]
+        for (row, col), acc in self.cells.items():
+            for r in (row_pos[row], total_row):
+                line = data[r]
+                for c in (col_pos[col], total_col):
+                    for k in range(width):
+                        line[c + k] += acc[k + 1]
+
+        frame = pd.DataFrame(data, index=pd.Index(row_labels + ["Total"], name=self.rows))
+        frame.columns = [(label, c) for c in col_labels + ["Total"] for label, _, _ in self.values]
+        return frame
+
+def display_pivot(pivot, rows, cols, values):
+    console.print(render_pivot(pivot, rows, cols, values))
+
+def render_pivot(pivot, rows, cols, values):
+    """
+    Formats the pivot matrix column-wise with numpy (blanking zeros) and hands finished rows to a Rich table.
+    """
+    import numpy as np
+    from rich.table import Table
+
+    described = ", ".join(
+        "Count of Issues" if label == "Count" else f"{agg.title()} of {source}"
+        for label, source, agg in values
+    )
+    table = Table(title=f"Pivot: {rows} (Rows) x {cols} (Cols) - {described}")
+    table.add_column(rows, style="cyan")
+    for label, col_name in pivot.columns:
+        table.add_column(str(col_name) if len(values) == 1 else f"{col_name}\n{label}", justify="right")
+
+    aggs = {label: agg for label, _, agg in values}
+    matrix = pivot.to_numpy(dtype=float)
+    cells = np.empty(matrix.shape, dtype=object)
+    for j, (label, _) in enumerate(pivot.columns):
+        column = matrix[:, j]
+        if aggs[label] == "count":
+            formatted = np.char.mod("%d", column.astype(np.int64))
+        else:
+            formatted = np.char.mod("%.1f", column)
+        cells[:, j] = np.where(column == 0, "", formatted)
+
+    for label, row_cells in zip(pivot.index, cells.tolist()):
+        table.add_row(str(label), *row_cells)
+    return table
+
+def add_epic_summaries(client, config, issues, show_progress=True):
+    """
+    Fills "Epic Summary" on parsed issues, resolving all distinct epics in one batch.
+    """
+    with metrics.phase("epic_summaries"):
+        epic_cache = client.resolve_epic_summaries(
+            (issue.get("Epic Link") for issue in issues), show_progress=show_progress
+        )
+    for issue in issues:
+        epic_link = issue.get("Epic Link")
+        if epic_link:
+            if config.anonymize:
+                issue["Epic Summary"] = f"Redacted Epic for {epic_link}"
+            else:
+                issue["Epic Summary"] = epic_cache.get(epic_link, "Error")
+        else:
+             issue["Epic Summary"] = ""
+
+def parse_jira_datetime(value):
+    """
+    Parses a Jira timestamp such as 2024-01-31T10:15:00.000+0100 into an aware UTC datetime.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+class ColumnarWriter:
+    """
+    Writes IssueRecord rows to .parquet, .arrow (Feather v2 / IPC file) or .csv with typed columns:
+    Points as float64 and Created/Updated as UTC timestamps.
+    Rows are buffered and flushed every `row_group_size` rows, so large results are written incrementally.
+    Parquet and Arrow need the optional pyarrow package; CSV falls back to the csv module without it.
+    """
+    FORMATS = (".parquet", ".arrow", ".csv")
+
+    def __init__(self, path, with_epic_summary=False, row_group_size=10000):
+        self.path = path
+        self.format = os.path.splitext(path)[1].lower()
+        if self.format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format '{self.format}' (use {', '.join(self.FORMATS)})")
+        self.columns = [c for c in IssueRecord.COLUMNS if c != "Epic Summary" or with_epic_summary]
+        self.columns += ["Created", "Updated"]
+        self.row_group_size = row_group_size
+        self.buffer = []
+        self.rows = 0
+        self.writer = None
+        self.csv_file = None
+
+        try:
+            import pyarrow  # noqa: F401
+            self.pa = pyarrow
+        except ImportError:
+            if self.format != ".csv":
+                raise ValueError("Writing .parquet/.arrow needs pyarrow: pip install pyarrow")
+            self.pa = None
+
+    def _schema(self):
+        pa = self.pa
+        types = {"Points": pa.float64(), "Created": pa.timestamp("ms", tz="UTC"), "Updated": pa.timestamp("ms", tz="UTC")}
+        return pa.schema([(c, types.get(c, pa.string())) for c in self.columns])
+
+    def _column_values(self, records, column):
+        if column == "Created":
+            return [parse_jira_datetime(r.created) for r in records]
+        if column == "Updated":
+            return [parse_jira_datetime(r.updated) for r in records]
+        attr = IssueRecord.COLUMNS[column]
+        return [getattr(r, attr) for r in records]
+
+    def write(self, records):
+        self.buffer.extend(records)
+        if len(self.buffer) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        records, self.buffer = self.buffer, []
+        self.rows += len(records)
+
+        if self.pa is None:
+            if self.csv_file is None:
+                self.csv_file = open(self.path, "w", newline="", encoding="utf-8")
+                self.writer = csv.writer(self.csv_file)
+                self.writer.writerow(self.columns)
+            columns = [self._column_values(records, c) for c in self.columns]
+            for row in zip(*columns):
+                self.writer.writerow(["" if v is None else v.isoformat() if isinstance(v, datetime) else v for v in row])
+            return
+
+        schema = self._schema()
+        batch = self.pa.record_batch([self.pa.array(self._column_values(records, c), type=schema.field(c).type) for c in self.columns], schema=schema)
+        if self.writer is None:
+            if self.format == ".parquet":
+                import pyarrow.parquet as pq
+                self.writer = pq.ParquetWriter(self.path, schema)
+            elif self.format == ".arrow":
+                self.writer = self.pa.ipc.new_file(self.path, schema)
+            else:
+                import pyarrow.csv as pa_csv
+                self.writer = pa_csv.CSVWriter(self.path, schema)
+        if self.format == ".parquet":
+            self.writer.write_table(self.pa.Table.from_batches([batch]))
+        else:
+            self.writer.write_batch(batch)
+
+    def close(self):
+        self._flush()
+        if self.writer is None:
+            self._write_empty()
+        elif self.csv_file is not None:
+            self.csv_file.close()
+        else:
+            self.writer.close()
+
+    def _write_empty(self):
+        # No rows: still produce a valid file carrying the schema
+        if self.pa is None:
+            with open(self.path, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(self.columns)
+            return
+        schema = self._schema()
+        empty = self.pa.Table.from_batches([], schema=schema)
+        if self.format == ".parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(empty, self.path)
+        elif self.format == ".arrow":
+            with self.pa.ipc.new_file(self.path, schema):
+                pass
+        else:
+            import pyarrow.csv as pa_csv
+            pa_csv.write_csv(empty, self.path)
+
+def write_issues(issues, fmt, header=True, out=None):
+    """
+    Writes parsed issues to stdout as tsv or jsonl and flushes, so callers can stream page by page.
+    """
+    out = out or sys.stdout
+    if fmt == "jsonl":
+        for issue in issues:
+            out.write(json.dumps(issue.to_dict(), ensure_ascii=False) + "\n")
+    elif issues:
+        columns = list(issues[0].keys())
+        if header:
+            out.write("\t".join(columns) + "\n")
+        for issue in issues:
+            cells = (issue.display(c) for c in columns)
+            out.write("\t".join(c.replace("\t", " ").replace("\n", " ") for c in cells) + "\n")
+    out.flush()
+
+def display_issues(issues):
+    console.print(render_issues(issues))
+
+def render_issues(issues):
+    """
+    Builds a Rich table of issues.
+    """
+    from rich.table import Table
+
+    table = Table(title=f"Jira Search Results ({len(issues)})")
+
+    table.add_column("Key", style="cyan", no_wrap=True)
+    table.add_column("Type", style="magenta")
+    table.add_column("Summary", style="white")
+    table.add_column("Status", style="green")
+    table.add_column("Priority", style="yellow")
+    table.add_column("Assignee", style="blue")
+    table.add_column("Sprint", style="bold")
+    table.add_column("Points", justify="right")
+    table.add_column("Epic Link", style="dim")
+    
+    # Check if any issue has "Epic Summary" to decide if we show the column
+    if issues and "Epic Summary" in issues[0]:
+        table.add_column("Epic Summary", style="blue")
+
+    for issue in issues:
+        table.add_row(*[issue.display(label) for label in issue.keys()])
+    return table
+
+def display_connection_stats(stats):
+    """
+    Renders the connection pool counters collected during the run.
+    Printed to stderr like --profile, so tsv/jsonl written to stdout stays clean.
+    """
+    from rich.table import Table
+
+    table = Table(title="HTTP Connections")
+    table.add_column("Requests", justify="right", style="cyan")
+    table.add_column("Opened", justify="right", style="yellow")
+    table.add_column("Reused", justify="right", style="green")
+    table.add_row(str(stats["requests"]), str(stats["opened"]), str(stats["reused"]))
+    Console(stderr=True).print(table)
+
+def display_metrics(snapshot):
+    """
+    Renders the --profile summary: phase timings, HTTP requests per endpoint and cache hit rates.
+    Printed to stderr so tsv/jsonl written to stdout stays clean.
+    """
+    from rich.table import Table
+
+    out = Console(stderr=True)
+
+    total = snapshot["total_seconds"]
+    table = Table(title=f"Phases ({total:.2f}s total)")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Seconds", justify="right", style="yellow")
+    table.add_column("Share", justify="right")
+    table.add_column("Calls", justify="right", style="dim")
+    for name, entry in sorted(snapshot["phases"].items(), key=lambda item: -item[1]["seconds"]):
+        share = entry["seconds"] / total if total else 0
+        table.add_row(name, f"{entry['seconds']:.3f}", f"{share:.0%}", str(entry["calls"]))
+    out.print(table)
+
+    if snapshot["http"]:
+        table = Table(title="HTTP Requests")
+        table.add_column("Endpoint", style="cyan", no_wrap=True)
+        table.add_column("Requests", justify="right")
+        table.add_column("Retries", justify="right", style="red")
+        table.add_column("KiB", justify="right", style="yellow")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p95 ms", justify="right")
+        table.add_column("Statuses", style="dim")
+        for endpoint, entry in sorted(snapshot["http"].items()):
+            latency = entry["latency_ms"]
+            table.add_row(
+                endpoint, str(entry["requests"]), str(entry["retries"]), f"{entry['bytes'] / 1024:.1f}",
+                f"{latency['p50']:.1f}", f"{latency['p95']:.1f}",
+                " ".join(f"{status}:{count}" for status, count in sorted(entry["statuses"].items())),
+            )
+        out.print(table)
+
+    if snapshot["caches"]:
+        table = Table(title="Caches")
+        table.add_column("Cache", style="cyan")
+        table.add_column("Hits", justify="right", style="green")
+        table.add_column("Misses", justify="right", style="red")
+        table.add_column("Hit Rate", justify="right")
+        for name, entry in sorted(snapshot["caches"].items()):
+            rate = "-" if entry["hit_rate"] is None else f"{entry['hit_rate']:.0%}"
+            table.add_row(name, str(entry["hits"]), str(entry["misses"]), rate)
+        out.print(table)
+
+def write_metrics(path, snapshot, command):
+    """
+    Writes a metrics snapshot as JSON for charting runs against each other.
+    """
+    data = {"command": command, "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"), **snapshot}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+def display_issue_detail(issue_data, client, config):
+    """
+    Renders detailed view of a single issue.
+    """
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.columns import Columns
+    from rich.markdown import Markdown
+    from rich.text import Text
+    
+    fields = issue_data.get("fields", {})
+    key = issue_data.get("key")
+    
+    # helper to get safe value
+    def g(path, default=""):
+        val = fields
+        for p in path.split('.'):
+            if isinstance(val, dict):
+                val = val.get(p, {})
+            else:
+                return default
+        return val if isinstance(val, (str, int, float)) else default
+
+    summary = fields.get("summary", "")
+    if config.anonymize:
+        summary = f"Redacted Summary for {key}"
+
+    description = fields.get("description")
+    if config.anonymize and description:
+        description = "Redacted Description"
+    
+    # Resolve Epic Name if link exists
+    epic_link = fields.get(config.field_epic_link)
+    epic_name = ""
+    if epic_link:
+        raw_name = client.get_epic_summary(epic_link)
+        epic_name = f"Redacted Epic for {epic_link}" if config.anonymize else raw_name
+
+    # Fix Versions
+    fix_versions = ", ".join([v.get("name") for v in fields.get("fixVersions", [])])
+
+    # Assignee
+    assignee = fields.get("assignee", {}).get("displayName") if fields.get("assignee") else "Unassigned"
+
+    # Status & Priority
+    status = fields.get("status", {}).get("name")
+    priority = fields.get("priority", {}).get("name")
+    
+    # Type
+    issue_type = fields.get("issuetype", {}).get("name")
+    
+    # Points
+    points = fields.get(config.field_story_points, "")
+    
+    # Construct Content
+    grid = Table.grid(padding=(0, 2))
+    grid.add_column(style="cyan", justify="right")
+    grid.add_column(style="white")
+    
+    grid.add_row("Type:", issue_type)
+    grid.add_row("Status:", f"[bold green]{status}[/bold green]")
+    grid.add_row("Priority:", priority)
+    grid.add_row("Assignee:", assignee)
+    grid.add_row("Story Points:", str(points) if points is not None else "")
+    grid.add_row("Fix Version:", fix_versions)
+    grid.add_row("Epic Link:", str(epic_link))
+    grid.add_row("Epic Name:", f"[blue]{epic_name}[/blue]")
+
+    console.print(Panel(
+        grid,
+        title=f"[bold]{key}: {summary}[/bold]",
+        subtitle=f"Project: {fields.get('project', {}).get('name')}"
+    ))
+
+    if description:
+        console.print(Panel(Markdown(description), title="Description"))
+    else:
+        console.print(Panel("[italic]No description provided.[/italic]", title="Description"))
+
+    # Issue Link
+    issue_url = f"{config.jira_url}/browse/{key}"
+    console.print(f"\n[bold]Open in Jira:[/bold] [link={issue_url}]{issue_url}[/link]\n")
+
+def run_view(args, config, client):
+    """
+    Implements `view KEY [KEY ...]` and `view --jql`: fetches every issue in one batch,
+    resolves their epic summaries in one batch, then renders the panels in order.
+    """
+    if not args.keys and not args.jql:
+        console.print("[red]Error: Provide one or more issue keys or --jql.[/red]")
+        sys.exit(1)
+
+    with metrics.phase("fetch"):
+        if args.jql:
+            issues = client.search_issues(args.jql, limit=args.limit, fields=client.detail_fields())
+            ordered = [(issue.get("key"), issue) for issue in issues]
+        elif len(args.keys) == 1:
+            ordered = [(args.keys[0], client.get_issue(args.keys[0]))]
+        else:
+            found = client.get_issues(args.keys)
+            ordered = [(key, found.get(key.upper())) for key in args.keys]
+
+    epic_links = [(issue.get("fields") or {}).get(config.field_epic_link) for _, issue in ordered if issue]
+    if any(epic_links):
+        with metrics.phase("epic_summaries"):
+            client.resolve_epic_summaries(epic_links, show_progress=False)
+
+    with metrics.phase("render"):
+        for key, issue in ordered:
+            if issue:
+                display_issue_detail(issue, client, config)
+            elif len(ordered) > 1:
+                console.print(f"[red]Issue {key} was not found or is not visible.[/red]\n")
+
+    if args.jql and not ordered:
+        console.print("[yellow]No issues match the JQL.[/yellow]")
+
+def open_summary_cache(config):
+    return SummaryCache(
+        os.path.join(config.cache_dir, "summaries.db"),
+        ttl=config.summary_ttl,
+        max_entries=config.summary_max_entries
+    )
+
+def run_cache_command(args, config):
+    """
+    Implements `cache stats` and `cache clear` for the issue and summary caches.
+    """
+    summary_cache = open_summary_cache(config)
+    issue_cache = IssueCache(os.path.join(config.cache_dir, "issues.db"))
+    try:
+        sprint_path = os.path.join(config.cache_dir, "sprints.json")
+        if args.action == "clear":
+            summary_cache.clear()
+            issue_cache.clear()
+            if os.path.exists(sprint_path):
+                os.remove(sprint_path)
+            console.print(f"[green]Cleared caches in {config.cache_dir}[/green]")
+            return
+
+        from rich.table import Table
+
+        stats = summary_cache.stats()
+        table = Table(title=f"Cache: {config.cache_dir}")
+        table.add_column("Cache", style="cyan")
+        table.add_column("Entries", justify="right", style="green")
+        table.add_column("Details", style="white")
+        table.add_row(
+            "Summaries",
+            str(stats["entries"]),
+            f"{stats['fresh']} fresh, {stats['expired']} expired, {stats['hits']} hits "
+            f"(TTL {config.summary_ttl}s, max {config.summary_max_entries})"
+        )
+        issue_stats = issue_cache.stats()
+        table.add_row("Issues", str(issue_stats["issues"]), f"{issue_stats['queries']} cached queries")
+        sprint_index = SprintIndex(sprint_path, config.board_ids, ttl=config.sprint_ttl)
+        table.add_row(
+            "Sprints",
+            str(len(sprint_index.sprints)),
+            f"boards {', '.join(config.board_ids) or '-'} ({'fresh' if sprint_index.is_fresh() else 'stale'})"
+        )
+        console.print(table)
+    finally:
+        summary_cache.close()
+        issue_cache.close()
+
+def build_create_fields(config, project, summary, issue_type, description=None, assignee=None,
+                        points=None, epic_link=None, sprint_id=None):
+    """
+    Builds the `fields` payload for a new issue.
+    """
+    fields = {
+        "project": {"key": project},
+        "summary": summary,
+        "issuetype": {"name": issue_type},
+    }
+    if description:
+        fields["description"] = description
+    if assignee:
+        fields["assignee"] = {"name": assignee}
+    if points is not None:
+         fields[config.field_story_points] = points
+    if epic_link:
+         fields[config.field_epic_link] = epic_link
+    if sprint_id:
+        # Sprints usually require numeric ID
+        fields[config.field_sprints] = sprint_id
+    return fields
+
+# Accepted header spellings for --from-file columns
+BULK_COLUMN_ALIASES = {
+    "issue_type": "type", "issuetype": "type",
+    "story_points": "points",
+    "epic": "epic_link", "epic_key": "epic_link",
+    "sprint_name": "sprint",
+}
+
+def load_bulk_rows(path):
+    """
+    Reads rows for bulk create from a .csv (header row) or .jsonl file.
+    Column names are normalized, e.g. "Epic Link" -> epic_link.
+    """
+    def normalize(row):
+        out = {}
+        for name, value in row.items():
+            if name is None:
+                continue
+            name = name.strip().lower().replace(" ", "_").replace("-", "_")
+            name = BULK_COLUMN_ALIASES.get(name, name)
+            if isinstance(value, str):
+                value = value.strip()
+            if value not in (None, ""):
+                out[name] = value
+        return out
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.lower().endswith(".jsonl"):
+            rows = []
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"line {number}: {e}") from e
+                if not isinstance(row, dict):
+                    raise ValueError(f"line {number}: expected a JSON object, got {type(row).__name__}")
+                rows.append(normalize(row))
+            return rows
+        return [normalize(row) for row in csv.DictReader(f)]
+
+def run_bulk_create(args, config, client):
+    """
+    Implements `create --from-file`: validates every row, resolves each sprint once,
+    submits through the bulk endpoint and reports per-row failures.
+    """
+    from rich.table import Table
+
+    try:
+        rows = load_bulk_rows(args.from_file)
+    except (OSError, ValueError, csv.Error) as e:
+        console.print(f"[red]Error reading {args.from_file}: {e}[/red]")
+        sys.exit(1)
+
+    # Command-line flags act as defaults for columns missing from a row
+    defaults = {
+        "project": args.project, "summary": args.summary, "type": args.type,
+        "description": args.description, "assignee": args.assignee,
+        "points": args.points, "epic_link": args.epic_link, "sprint": args.sprint,
+    }
+    sprint_ids = {}
+    failures = []
+    payloads = []
+    row_numbers = []
+
+    for number, row in enumerate(rows, start=1):
+        values = {name: row.get(name, default) for name, default in defaults.items()}
+        missing = [name for name in ("project", "summary", "type") if not values[name]]
+        if missing:
+            failures.append((number, values["summary"], f"Missing {', '.join(missing)}"))
+            continue
+        points = values["points"]
+        if points is not None:
+            try:
+                points = float(points)
+            except (TypeError, ValueError):
+                failures.append((number, values["summary"], f"Invalid points '{points}'"))
+                continue
+        sprint_id = None
+        if values["sprint"]:
+            if values["sprint"] not in sprint_ids:
+                sprint_ids[values["sprint"]] = client.get_sprint_id(values["sprint"])
+            sprint_id = sprint_ids[values["sprint"]]
+            if not sprint_id:
+                failures.append((number, values["summary"], f"Unknown sprint '{values['sprint']}'"))
+                continue
+        payloads.append(build_create_fields(
+            config, values["project"], values["summary"], values["type"], description=values["description"],
+            assignee=values["assignee"], points=points, epic_link=values["epic_link"], sprint_id=sprint_id
+        ))
+        row_numbers.append(number)
+
+    start = time.perf_counter()
+    with metrics.phase("create"):
+        results = client.create_issues_bulk(payloads, parallel=args.parallel) if payloads else []
+    elapsed = time.perf_counter() - start
+
+    created = 0
+    for number, payload, (key, error) in zip(row_numbers, payloads, results):
+        if key:
+            created += 1
+        else:
+            failures.append((number, payload["summary"], error))
+
+    console.print(f"[green]Created {created} of {len(rows)} issues in {elapsed:.1f}s.[/green]")
+    if failures:
+        failures.sort()
+        table = Table(title=f"Failed Rows ({len(failures)})")
+        table.add_column("Row", justify="right", style="cyan")
+        table.add_column("Summary", style="white")
+        table.add_column("Error", style="red")
+        for number, summary, error in failures:
+            table.add_row(str(number), summary or "", error)
+        console.print(table)
+        sys.exit(1)
+
+def build_edit_fields(config, args):
+    """
+    Builds the `fields` payload for an edit from command-line flags (sprint is resolved by the caller).
+    """
+    fields = {}
+    if args.summary: fields["summary"] = args.summary
+    if args.description: fields["description"] = args.description
+    if args.type: fields["issuetype"] = {"name": args.type}
+    if args.assignee: fields["assignee"] = {"name": args.assignee}
+    if args.points is not None: fields[config.field_story_points] = args.points
+    if args.epic_link: fields[config.field_epic_link] = args.epic_link
+    if args.clear_sprint and not args.sprint:
+         # To clear a field in Jira, typically set to None/null
+         fields[config.field_sprints] = None
+    return fields
+
+def run_bulk_edit(args, client, fields):
+    """
+    Implements `edit --jql`: applies one field update to every matching issue,
+    or previews the matches with --dry-run.
+    """
+    from rich.table import Table
+
+    totals = []
+    with metrics.phase("search"):
+        issues = client.search_issues(args.jql, limit=args.limit, fields=["summary", "status"], on_total=totals.append)
+    keys = [issue.get("key") for issue in issues]
+    if not keys:
+        console.print("[yellow]No issues match the JQL.[/yellow]")
+        return
+
+    total = totals[0] if totals and totals[0] is not None else len(keys)
+    truncated = total > len(keys)
+    if truncated:
+        console.print(
+            f"[yellow]Warning: {total} issues match the JQL but --limit is {args.limit}; "
+            f"only the first {len(keys)} would be updated.[/yellow]"
+        )
+
+    if args.dry_run:
+        title = f"Dry run: {len(keys)} of {total} matching issues would be updated" if truncated \
+            else f"Dry run: {len(keys)} issues would be updated"
+        table = Table(title=title)
+        table.add_column("Key", style="cyan", no_wrap=True)
+        table.add_column("Summary", style="white")
+        table.add_column("Status", style="green")
+        for issue in issues:
+            fields_data = issue.get("fields", {})
+            table.add_row(issue.get("key"), fields_data.get("summary") or "", (fields_data.get("status") or {}).get("name") or "")
+        console.print(table)
+        console.print(f"[bold]Fields:[/bold] {json.dumps(fields)}")
+        return
+
+    if truncated:
+        console.print(f"[red]Aborting edit: raise --limit to at least {total} or narrow the JQL.[/red]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with metrics.phase("edit"):
+        results = client.edit_issues_bulk(keys, fields, parallel=args.parallel)
+    elapsed = time.perf_counter() - start
+
+    failures = [(key, error) for key, error in results if error]
+    rate = len(results) / elapsed if elapsed > 0 else float(len(results))
+    console.print(
+        f"[green]Updated {len(results) - len(failures)} of {len(results)} issues "
+        f"in {elapsed:.1f}s ({rate:.1f} issues/sec).[/green]"
+    )
+    if failures:
+        table = Table(title=f"Failed Issues ({len(failures)})")
+        table.add_column("Key", style="cyan", no_wrap=True)
+        table.add_column("Error", style="red")
+        for key, error in failures:
+            table.add_row(key, error)
+        console.print(table)
+        sys.exit(1)
+
+def available_columns(args):
+    """
+    Column labels search results will have; Epic Summary only with --epic-name.
+    """
+    return [label for label in IssueRecord.COLUMNS if label != "Epic Summary" or args.epic_name]
+
+def report_columns(args):
+    """
+    Returns the set of column labels a search report needs, or None for every column.
+    Only group-by and pivot reports are narrowed; issue rows always show every column,
+    including the table shown when no --group-by column is valid.
+    """
+    if args.output:
+        return None
+    labels = {label.lower(): label for label in available_columns(args)}
+
+    def known(names):
+        return [labels[name.strip().lower()] for name in names if name and name.strip().lower() in labels]
+
+    group_cols = known(args.group_by.split(',')) if args.group_by else []
+    if group_cols:
+        requested = group_cols
+    elif args.pivot_rows and args.pivot_cols:
+        requested = known([args.pivot_rows, args.pivot_cols] + args.pivot_values.split(','))
+    else:
+        return None
+    # Count uses Key and the group-by totals sum Points
+    columns = {"Key", "Points"}
+    columns.update(requested + known([args.sort]))
+    if args.epic_name:
+        columns.add("Epic Link")
+    return columns
+
+def run_command(args, config, client, issue_parser, session=None):
+    """
+    Dispatches a parsed subcommand against an initialized client.
+    Inside a shell/daemon `session`, searches reuse its open issue cache and fresh results.
+    """
+    if args.command == "search":
+        jql = args.jql
+        if not jql:
+            jql = console.input("[bold yellow]Enter JQL query:[/bold yellow] ")
+        
+        if args.watch is not None:
+            if args.watch <= 0:
+                console.print("[red]Error: --watch needs a positive number of seconds.[/red]")
+                sys.exit(1)
+            if args.export or args.output or args.format != "table" or args.offline:
+                console.print("[red]Error: --watch redraws a table and cannot be combined with --export, --output, --format tsv/jsonl or --offline.[/red]")
+                sys.exit(1)
+            from jira_watch import run_watch, watch_search
+
+        if args.export:
+            from jira_export import run_export
+
+            run_export(args, config, client, issue_parser, jql)
+            return
+
+        if args.output and (args.group_by or args.pivot_rows):
+            console.print("[red]Error: --output writes issue rows and cannot be combined with --group-by or --pivot-*.[/red]")
+            sys.exit(1)
+
+        # Report columns are checked before fetching, since the fetched fields depend on them
+        available = available_columns(args)
+        valid_group_cols = resolve_columns(args.group_by.split(','), available) if args.group_by else []
+        pivot_spec = None
+        if not valid_group_cols and args.pivot_rows and args.pivot_cols:
+            avail = {c.lower(): c for c in available}
+            rows = args.pivot_rows
+            cols = args.pivot_cols
+            if rows.lower() not in avail or cols.lower() not in avail:
+                 console.print(f"[red]Error: Columns '{rows}' or '{cols}' not found.[/red]")
+                 sys.exit(1)
+            pivot_spec = (avail[rows.lower()], avail[cols.lower()], resolve_pivot_values(args.pivot_values, avail))
+
+        writer = None
+        if args.output:
+            try:
+                writer = ColumnarWriter(args.output, with_epic_summary=args.epic_name)
+            except ValueError as e:
+                console.print(f"[red]Error: {e}[/red]")
+                sys.exit(1)
+
+        # tsv/jsonl rows can be written page by page unless the report needs every row first
+        streaming = (writer or args.format != "table") and not (args.sort or valid_group_cols or pivot_spec)
+        # Progress bars would corrupt tsv/jsonl written to stdout
+        show_progress = writer is not None or not streaming
+
+        # Reports that need neither sorted rows nor epic names are fed page by page, so the
+        # records never have to be held all at once
+        aggregator = None
+        if not (args.sort or args.watch):
+            backend = args.group_backend or config.group_backend
+            if valid_group_cols and backend != "pandas" and "Epic Summary" not in valid_group_cols:
+                aggregator = GroupByAggregator(valid_group_cols)
+            elif pivot_spec and "Epic Summary" not in pivot_spec[:2] + tuple(source for _, source, _ in pivot_spec[2]):
+                aggregator = PivotAggregator(*pivot_spec)
+
+        # Only fetch and parse the fields the report actually shows
+        columns = report_columns(args)
+        if args.watch and columns is not None:
+            # Polls continue from the newest `updated` seen
+            columns.add("Updated")
+        fields = client.fields_for_columns(columns)
+
+        cache = None
+        if (config.issue_cache and not args.no_cache) or args.offline:
+            cache = session.open_issue_cache() if session else IssueCache(os.path.join(config.cache_dir, "issues.db"))
+        try:
+            if cache:
+                pages = client.iter_sync_pages(
+                    jql, cache, limit=args.limit, parallel=args.parallel,
+                    offline=args.offline, refresh=args.refresh, show_progress=show_progress, fields=fields,
+                    max_age=config.session_freshness if session else None
+                )
+            else:
+                pages = client.iter_search_pages(
+                    jql, limit=args.limit, parallel=args.parallel, fields=fields, show_progress=show_progress
+                )
+
+            def parse_pages(pages):
+                # Raw pages are dropped as soon as they are parsed
+                for page in metrics.timed_pages("search", pages):
+                    with metrics.phase("parse"):
+                        parsed = issue_parser.parse(page, columns)
+                    yield parsed
+
+            parsed_pages = parse_pages(pages)
+
+            if streaming:
+                write_header = True
+                written = 0
+                for page in parsed_pages:
+                    if args.epic_name:
+                        add_epic_summaries(client, config, page, show_progress=False)
+                    with metrics.phase("write"):
+                        if writer:
+                            writer.write(page)
+                        else:
+                            write_issues(page, args.format, header=write_header)
+                    written += len(page)
+                    write_header = False
+                if writer:
+                    with metrics.phase("write"):
+                        writer.close()
+                    console.print(f"[green]Wrote {written} issues to {args.output}.[/green]")
+                return
+
+            if aggregator is not None:
+                phase = "pivot" if pivot_spec else "group_by"
+                for page in parsed_pages:
+                    with metrics.phase(phase):
+                        aggregator.extend(page)
+            else:
+                parsed_issues = [issue for page in parsed_pages for issue in page]
+        finally:
+            if cache and not session:
+                cache.close()
+
+        if isinstance(aggregator, GroupByAggregator):
+            with metrics.phase("render"):
+                display_grouped(valid_group_cols, aggregator.rows())
+            sys.exit(0)
+
+        if isinstance(aggregator, PivotAggregator):
+            try:
+                with metrics.phase("render"):
+                    display_pivot(aggregator.frame(), *pivot_spec)
+                sys.exit(0)
+            except Exception as e:
+                console.print(f"[red]Pivot Error: {e}[/red]")
+                sys.exit(1)
+
+        if args.sort:
+            with metrics.phase("sort"):
+                sort_issues(parsed_issues, args.sort)
+
+        if args.epic_name:
+            add_epic_summaries(client, config, parsed_issues)
+
+        if valid_group_cols:
+            if args.watch:
+                aggregator = GroupByAggregator(valid_group_cols)
+                watcher = watch_search(args, config, client, issue_parser, jql, columns, parsed_issues, aggregator)
+                run_watch(watcher, args.watch, lambda w: render_grouped(valid_group_cols, aggregator.rows()))
+                sys.exit(0)
+
+            backend = args.group_backend or config.group_backend
+            with metrics.phase("group_by"):
+                if backend == "pandas":
+                    groups = group_issues_pandas(parsed_issues, valid_group_cols)
+                else:
+                    aggregator = GroupByAggregator(valid_group_cols)
+                    aggregator.extend(parsed_issues)
+                    groups = aggregator.rows()
+            with metrics.phase("render"):
+                display_grouped(valid_group_cols, groups)
+            sys.exit(0)
+
+        if pivot_spec:
+            rows, cols, values = pivot_spec
+
+            if args.watch:
+                aggregator = PivotAggregator(rows, cols, values)
+                watcher = watch_search(args, config, client, issue_parser, jql, columns, parsed_issues, aggregator)
+                run_watch(watcher, args.watch, lambda w: render_pivot(aggregator.frame(), rows, cols, values))
+                sys.exit(0)
+
+            try:
+                with metrics.phase("pivot"):
+                    pivot = build_pivot(parsed_issues, rows, cols, values)
+                with metrics.phase("render"):
+                    display_pivot(pivot, rows, cols, values)
+                sys.exit(0)
+            except Exception as e:
+                console.print(f"[red]Pivot Error: {e}[/red]")
+                sys.exit(1)
+
+        if writer:
+            with metrics.phase("write"):
+                writer.write(parsed_issues)
+                writer.close()
+            console.print(f"[green]Wrote {len(parsed_issues)} issues to {args.output}.[/green]")
+        elif args.watch:
+            def render(watcher):
+                issues = list(watcher.records.values())
+                if args.sort:
+                    sort_issues(issues, args.sort)
+                return render_issues(issues)
+
+            run_watch(watch_search(args, config, client, issue_parser, jql, columns, parsed_issues), args.watch, render)
+        elif args.format == "table":
+            with metrics.phase("render"):
+                display_issues(parsed_issues)
+        else:
+            with metrics.phase("write"):
+                write_issues(parsed_issues, args.format)
+
+    elif args.command == "create":
+        if args.from_file:
+            run_bulk_create(args, config, client)
+            return
+
+        missing = [flag for flag in ("project", "summary", "type") if not getattr(args, flag)]
+        if missing:
+            console.print(f"[red]Error: Missing required arguments: {', '.join('--' + m for m in missing)}[/red]")
+            sys.exit(1)
+
+        sprint_id = None
+        if args.sprint:
+            sprint_id = client.get_sprint_id(args.sprint)
+            if not sprint_id:
+                console.print(f"[red]Aborting create: Could not resolve ID for sprint '{args.sprint}'[/red]")
+                sys.exit(1)
+
+        fields = build_create_fields(
+            config, args.project, args.summary, args.type, description=args.description,
+            assignee=args.assignee, points=args.points, epic_link=args.epic_link, sprint_id=sprint_id
+        )
+        result = client.create_issue(fields)
+        if result:
+            console.print(f"[green]Issue Created: {result.get('key')} - {result.get('self')}[/green]")
+
+    elif args.command == "edit":
+        if bool(args.key) == bool(args.jql):
+            console.print("[red]Error: Give either an issue key or --jql.[/red]")
+            sys.exit(1)
+
+        fields = build_edit_fields(config, args)
+        if not fields and not args.sprint:
+            console.print("[yellow]No fields to update.[/yellow]")
+            sys.exit(0)
+
+        if args.sprint:
+            # Resolved once, even when many issues are updated
+            sprint_id = client.get_sprint_id(args.sprint)
+            if sprint_id:
+                fields[config.field_sprints] = sprint_id
+            else:
+                console.print(f"[red]Aborting edit: Could not resolve ID for sprint '{args.sprint}'[/red]")
+                sys.exit(1)
+
+        if args.jql:
+            run_bulk_edit(args, client, fields)
+            return
+
+        success = client.edit_issue(args.key, fields)
+        if success:
+            console.print(f"[green]Issue {args.key} updated successfully.[/green]")
+
+    elif args.command == "view":
+        run_view(args, config, client)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Jira CLI - Terminal Client for Jira")
+    parser.add_argument("--conn-stats", action="store_true", help="Print HTTP connections opened vs reused on exit")
+    parser.add_argument("--profile", action="store_true", help="Print phase timings, HTTP request metrics and cache hit rates on exit")
+    parser.add_argument("--metrics-out", help="Write phase timings, HTTP request metrics and cache hit rates to this JSON file")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    # Search Command
+    search_parser = subparsers.add_parser("search", help="Search issues using JQL")
+    search_parser.add_argument("--jql", help="JQL Query string", required=False)
+    search_parser.add_argument("--limit", type=int, default=50, help="Max results to return")
+    search_parser.add_argument("--sort", help="Column to sort by (e.g. status, assignee, priority)", required=False)
+    search_parser.add_argument("--parallel", type=int, default=None, help="Concurrent page requests (default: JIRA_PARALLEL)")
+    search_parser.add_argument("--format", choices=["table", "tsv", "jsonl"], default="table", help="Output format; tsv/jsonl rows are printed as pages arrive")
+    search_parser.add_argument("--output", help="Write typed columnar results to a .parquet, .arrow or .csv file")
+    search_parser.add_argument("--export", help="Write all results to a .jsonl file, checkpointing after every page")
+    search_parser.add_argument("--resume", action="store_true", help="Continue an interrupted --export from its checkpoint")
+    search_parser.add_argument("--offline", action="store_true", help="Answer from the local issue cache without contacting Jira")
+    search_parser.add_argument("--refresh", action="store_true", help="Ignore the cache watermark and re-download all issues")
+    search_parser.add_argument("--no-cache", action="store_true", help="Bypass the local issue cache")
+    search_parser.add_argument("--epic-name", action="store_true", help="Fetch and show Epic names")
+    search_parser.add_argument("--group-by", help="Comma-separated columns to group by (e.g. Status,Assignee)", required=False)
+    search_parser.add_argument("--group-backend", choices=["python", "pandas"], help="Aggregation engine for --group-by (default: JIRA_GROUP_BACKEND)")
+    search_parser.add_argument("--pivot-rows", help="Row field for pivot table", required=False)
+    search_parser.add_argument("--pivot-cols", help="Column field for pivot table", required=False)
+    search_parser.add_argument("--pivot-values", help="Comma-separated value fields for pivot table, e.g. Count,Points (default: Points)", default="Points", required=False)
+    search_parser.add_argument("--watch", type=float, metavar="SECONDS", help="Redraw the table or report in place, polling only issues updated since the last poll")
+
+    # Create Command
+    create_parser = subparsers.add_parser("create", help="Create a new issue")
+    create_parser.add_argument("--project", required=False, help="Project Key (e.g. PROJ)")
+    create_parser.add_argument("--summary", required=False, help="Issue Summary")
+    create_parser.add_argument("--type", required=False, help="Issue Type (e.g. Story, Bug)")
+    create_parser.add_argument("--description", required=False, help="Issue Description")
+    create_parser.add_argument("--assignee", required=False, help="Assignee username")
+    create_parser.add_argument("--points", type=float, required=False, help="Story Points")
+    create_parser.add_argument("--epic-link", required=False, help="Epic Link Key")
+    create_parser.add_argument("--sprint", required=False, help="Sprint Name")
+    create_parser.add_argument("--from-file", required=False, help="Bulk create from a .csv or .jsonl file; flags above become per-row defaults")
+    create_parser.add_argument("--parallel", type=int, default=None, help="Concurrent bulk requests (default: JIRA_PARALLEL)")
+
+    # Edit Command
+    edit_parser = subparsers.add_parser("edit", help="Edit an issue")
+    edit_parser.add_argument("key", nargs="?", help="Issue Key (e.g. PROJ-123)")
+    edit_parser.add_argument("--jql", required=False, help="Update every issue matching this JQL instead of a single key")
+    edit_parser.add_argument("--limit", type=int, default=1000, help="Max issues to update with --jql")
+    edit_parser.add_argument("--dry-run", action="store_true", help="With --jql, list the matching issues without updating them")
+    edit_parser.add_argument("--parallel", type=int, default=None, help="Concurrent updates with --jql (default: JIRA_PARALLEL)")
+    edit_parser.add_argument("--summary", required=False, help="New Summary")
+    edit_parser.add_argument("--description", required=False, help="New Description")
+    edit_parser.add_argument("--type", required=False, help="New Issue Type")
+    edit_parser.add_argument("--assignee", required=False, help="New Assignee")
+    edit_parser.add_argument("--points", type=float, required=False, help="New Story Points")
+    edit_parser.add_argument("--epic-link", required=False, help="New Epic Link")
+    edit_parser.add_argument("--sprint", required=False, help="Sprint Name to move ticket to")
+    edit_parser.add_argument("--clear-sprint", action="store_true", help="Remove ticket from sprint")
+    
+    # View Command
+    view_parser = subparsers.add_parser("view", help="View issue details")
+    view_parser.add_argument("keys", nargs="*", metavar="KEY", help="Issue keys (e.g. PROJ-123 PROJ-124)")
+    view_parser.add_argument("--jql", required=False, help="View every issue matching this JQL instead of listed keys")
+    view_parser.add_argument("--limit", type=int, default=50, help="Max issues to view with --jql")
+
+    # Cache Command
+    cache_parser = subparsers.add_parser("cache", help="Inspect or clear the local caches")
+    cache_parser.add_argument("action", choices=["stats", "clear"], help="Action to perform")
+
+    # Shell Command
+    subparsers.add_parser("shell", help="Interactive shell that keeps the client and caches warm between commands")
+
+    # Daemon Command
+    daemon_parser = subparsers.add_parser("daemon", help="Background process serving commands from jira_remote.py over a Unix socket")
+    daemon_parser.add_argument("action", choices=["start", "stop", "status", "run"], help="run stays in the foreground")
+
+    return parser
+
+def finish_run(args, client, argv):
+    """
+    Prints or writes the end-of-command reports asked for with --conn-stats, --profile and --metrics-out.
+    """
+    if args.conn_stats:
+        display_connection_stats(client.connection_stats())
+    if args.profile or args.metrics_out:
+        snapshot = metrics.snapshot()
+        if args.profile:
+            display_metrics(snapshot)
+        if args.metrics_out:
+            write_metrics(args.metrics_out, snapshot, argv)
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    # Load Config
+    config = ConfigLoader()
+
+    # The cache command only touches local files and needs no Jira credentials
+    if args.command == "cache":
+        run_cache_command(args, config)
+        return
+
+    if args.command == "daemon" and args.action in ("stop", "status"):
+        from jira_daemon import run_daemon_control
+
+        run_daemon_control(args, config)
+        return
+
+    config.validate()
+
+    if args.command in ("shell", "daemon"):
+        from jira_daemon import Session, run_daemon, run_shell, start_daemon
+
+        if args.command == "daemon" and args.action == "start":
+            start_daemon(config)
+            return
+        session = Session(config, parser)
+        try:
+            if args.command == "shell":
+                run_shell(session)
+            else:
+                run_daemon(session)
+        finally:
+            session.close()
+        return
+
+    # Initialize Client
+    summary_cache = open_summary_cache(config) if config.summary_cache else None
+    client = JiraClient(config, summary_cache=summary_cache)
+    issue_parser = IssueParser(config)
+
+    try:
+        run_command(args, config, client, issue_parser)
+    finally:
+        finish_run(args, client, sys.argv[1:])
+        client.close()
+        if summary_cache:
+            summary_cache.close()
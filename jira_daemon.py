@@ -0,0 +1,331 @@
+"""
+Warm sessions for `shell` and the `daemon` that jira_remote.py talks to.
+"""
+import io
+import os
+import sys
+import json
+import time
+import socketserver
+from contextlib import redirect_stderr, redirect_stdout
+
+from rich.console import Console
+
+import jira_core as core
+from jira_core import (
+    IssueCache, IssueParser, JiraClient, finish_run, metrics, open_summary_cache, run_cache_command, run_command
+)
+
+class Session:
+    """
+    Warm state shared by every command of a `shell` or daemon session: one config, one client
+    (pooled session, epic and sprint caches), and the summary and issue caches kept open.
+    """
+    # Commands that manage sessions themselves
+    EXCLUDED = ("shell", "daemon")
+
+    def __init__(self, config, parser):
+        self.config = config
+        self.parser = parser
+        self.summary_cache = open_summary_cache(config) if config.summary_cache else None
+        self.client = JiraClient(config, summary_cache=self.summary_cache)
+        self.issue_parser = IssueParser(config)
+        self.issue_cache = None
+        self.started = time.time()
+        self.commands = 0
+
+    def open_issue_cache(self):
+        if self.issue_cache is None:
+            self.issue_cache = IssueCache(os.path.join(self.config.cache_dir, "issues.db"))
+        return self.issue_cache
+
+    def run(self, argv):
+        """
+        Runs one command line (without the program name) and returns its exit code.
+        Errors and sys.exit() inside commands end the command, not the session.
+        """
+        try:
+            args = self.parser.parse_args(argv)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+        if not args.command or args.command in self.EXCLUDED:
+            core.console.print("[red]Error: Enter a command such as search, view, create, edit or cache.[/red]")
+            return 1
+
+        self.commands += 1
+        metrics.reset()
+        # A failed lookup may be a transient error; it must not stick for the rest of the session
+        self.client.forget_failed_epics()
+        try:
+            if args.command == "cache":
+                run_cache_command(args, self.config)
+                if args.action == "clear":
+                    self.client.epic_cache.clear()
+                    self.client.sprint_index = None
+            else:
+                run_command(args, self.config, self.client, self.issue_parser, session=self)
+            return 0
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except KeyboardInterrupt:
+            core.console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+            return 130
+        except EOFError:
+            core.console.print("[red]Error: This command needs interactive input here; pass it as an option (e.g. --jql).[/red]")
+            return 1
+        except Exception as e:
+            core.console.print(f"[red]Error: {e}[/red]")
+            return 1
+        finally:
+            finish_run(args, self.client, argv)
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started),
+            "commands": self.commands,
+            "epic_cache_entries": len(self.client.epic_cache),
+            "connections": self.client.connection_stats(),
+        }
+
+    def close(self):
+        self.client.close()
+        if self.summary_cache:
+            self.summary_cache.close()
+        if self.issue_cache:
+            self.issue_cache.close()
+
+def run_shell(session):
+    """
+    Implements `shell`: runs command lines such as `search --jql "..."` against one warm
+    session until `exit`, `quit` or Ctrl+D.
+    """
+    import shlex
+
+    try:
+        import readline
+    except ImportError:
+        readline = None
+    history = os.path.join(session.config.cache_dir, "shell_history")
+    if readline:
+        try:
+            readline.read_history_file(history)
+        except OSError:
+            pass
+
+    core.console.print("[bold]Jira shell.[/bold] Enter commands without the program name, e.g. "
+                  "[cyan]search --jql \"project = PROJ\" --group-by Status[/cyan]. Type [cyan]help[/cyan] or [cyan]exit[/cyan].")
+    try:
+        while True:
+            try:
+                line = input("jira> ").strip()
+            except EOFError:
+                core.console.print()
+                break
+            except KeyboardInterrupt:
+                core.console.print()
+                continue
+            if not line:
+                continue
+            if line in ("exit", "quit"):
+                break
+            if line == "help":
+                session.parser.print_help()
+                continue
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                core.console.print(f"[red]Error: {e}[/red]")
+                continue
+            session.run(argv)
+    finally:
+        if readline:
+            try:
+                os.makedirs(session.config.cache_dir, exist_ok=True)
+                readline.set_history_length(1000)
+                readline.write_history_file(history)
+            except OSError:
+                pass
+
+class _FrameWriter(io.TextIOBase):
+    """
+    Text stream that forwards writes to a daemon client as {"stream": ..., "data": ...} JSON lines.
+    Reports the client's terminal as its own, so Rich keeps colours and progress bars.
+    """
+    def __init__(self, sock_file, name, tty):
+        self.sock_file = sock_file
+        self.name = name
+        self.tty = tty
+
+    def write(self, text):
+        if text:
+            self.sock_file.write(json.dumps({"stream": self.name, "data": text}).encode("utf-8") + b"\n")
+        return len(text)
+
+    def flush(self):
+        self.sock_file.flush()
+
+    def isatty(self):
+        return self.tty
+
+    def writable(self):
+        return True
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one connection: a {"control": "status" | "stop"} request or a command line to run.
+    """
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline() or b"{}")
+            control = request.get("control")
+            if control == "status":
+                self.reply({"status": self.server.session.status()})
+            elif control == "stop":
+                self.server.running = False
+                self.reply({"stopped": True})
+            elif "argv" in request:
+                self.reply({"exit": self.run_remote(request)})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away (e.g. Ctrl+C); nothing left to report to
+            pass
+
+    def reply(self, message):
+        self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def run_remote(self, request):
+        tty = bool(request.get("tty"))
+        out = _FrameWriter(self.wfile, "stdout", tty)
+        err = _FrameWriter(self.wfile, "stderr", tty)
+        saved_console, saved_cwd = core.console, os.getcwd()
+        # Output goes to the client's terminal, at its width; relative paths resolve from its directory
+        core.console = Console(file=out, width=request.get("columns") or None)
+        try:
+            os.chdir(request.get("cwd") or saved_cwd)
+            with redirect_stdout(out), redirect_stderr(err):
+                saved_stdin, sys.stdin = sys.stdin, io.StringIO()
+                try:
+                    return self.server.session.run(request["argv"])
+                finally:
+                    sys.stdin = saved_stdin
+        finally:
+            core.console = saved_console
+            os.chdir(saved_cwd)
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server that runs one command at a time against a warm session.
+    Exits on `daemon stop` or after `idle_timeout` seconds without a request.
+    """
+    def __init__(self, path, session, idle_timeout=None):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if os.path.exists(path):
+            os.remove(path)
+        # Only the owner may connect: the daemon acts with the configured Jira credentials
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, _DaemonHandler)
+        finally:
+            os.umask(old_umask)
+        self.session = session
+        self.timeout = idle_timeout or None
+        self.running = True
+
+    def handle_timeout(self):
+        self.running = False
+
+    def serve_until_stopped(self):
+        try:
+            while self.running:
+                self.handle_request()
+        finally:
+            self.server_close()
+            if os.path.exists(self.server_address):
+                os.remove(self.server_address)
+
+def daemon_request(path, message, timeout=5):
+    """
+    Sends a control message to a running daemon and returns its reply, or None if none is listening.
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+def run_daemon(session):
+    """
+    Implements `daemon run`: serves commands from jira_remote.py in the foreground.
+    """
+    import socket
+
+    config = session.config
+    if not hasattr(socket, "AF_UNIX"):
+        core.console.print("[red]Error: The daemon needs Unix domain sockets, which this platform lacks.[/red]")
+        sys.exit(1)
+    if daemon_request(config.daemon_socket, {"control": "status"}):
+        core.console.print(f"[red]Error: A daemon is already listening on {config.daemon_socket}.[/red]")
+        sys.exit(1)
+    server = DaemonServer(config.daemon_socket, session, idle_timeout=config.daemon_idle_timeout)
+    core.console.print(f"[green]Daemon listening on {config.daemon_socket} (pid {os.getpid()}).[/green]")
+    server.serve_until_stopped()
+
+def start_daemon(config, wait=10.0):
+    """
+    Implements `daemon start`: launches `daemon run` detached and waits until it answers.
+    """
+    import subprocess
+
+    if daemon_request(config.daemon_socket, {"control": "status"}):
+        core.console.print(f"[yellow]Daemon already running on {config.daemon_socket}.[/yellow]")
+        return
+    os.makedirs(config.cache_dir, exist_ok=True)
+    log_path = os.path.join(config.cache_dir, "daemon.log")
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "jira_cli.py"), "daemon", "run"],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True
+        )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        reply = daemon_request(config.daemon_socket, {"control": "status"})
+        if reply:
+            core.console.print(f"[green]Daemon started (pid {reply['status']['pid']}) on {config.daemon_socket}.[/green]")
+            return
+        time.sleep(0.1)
+    core.console.print(f"[red]Error: Daemon did not start; see {log_path}.[/red]")
+    sys.exit(1)
+
+def run_daemon_control(args, config):
+    """
+    Implements `daemon stop` and `daemon status`.
+    """
+    if args.action == "stop":
+        reply = daemon_request(config.daemon_socket, {"control": "stop"})
+        if reply:
+            core.console.print("[green]Daemon stopped.[/green]")
+        else:
+            core.console.print("[yellow]No daemon is running.[/yellow]")
+        return
+
+    reply = daemon_request(config.daemon_socket, {"control": "status"})
+    if not reply:
+        core.console.print("[yellow]No daemon is running.[/yellow]")
+        sys.exit(1)
+    status = reply["status"]
+    connections = status["connections"]
+    core.console.print(
+        f"Daemon pid {status['pid']} on {config.daemon_socket}: up {status['uptime_seconds']}s, "
+        f"{status['commands']} commands served, {status['epic_cache_entries']} epic summaries in memory, "
+        f"{connections['requests']} HTTP requests over {connections['opened']} connections."
+    )
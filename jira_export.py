@@ -0,0 +1,82 @@
+"""
+`search --export`: checkpointed JSON Lines exports that can resume after an interruption.
+"""
+import os
+import sys
+import json
+
+import jira_core as core
+from jira_core import add_epic_summaries, metrics, split_order_by
+
+class ExportCheckpoint:
+    """
+    Sidecar file (<export>.checkpoint) recording the JQL, field list, next offset and
+    the export file size after the last complete page.
+    """
+    def __init__(self, export_path):
+        self.path = f"{export_path}.checkpoint"
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def run_export(args, config, client, issue_parser, jql):
+    """
+    Implements `search --export FILE [--resume]`: writes parsed issues as jsonl page by page and
+    checkpoints after each page, so an interrupted export continues from the last complete page.
+    """
+    # Offsets are only meaningful if the result order is stable between runs
+    if not split_order_by(jql)[1]:
+        jql = f"{jql} ORDER BY key ASC"
+    fields = client.default_search_fields()
+    checkpoint = ExportCheckpoint(args.export)
+
+    state = checkpoint.load() if args.resume else None
+    if state and (state.get("jql") != jql or state.get("fields") != fields):
+        core.console.print("[red]Error: The checkpoint was written for a different JQL or field list. "
+                      "Run without --resume to start over.[/red]")
+        sys.exit(1)
+
+    if state and os.path.exists(args.export):
+        out = open(args.export, "r+b")
+        # Drop anything written after the last complete page
+        out.truncate(state["bytes"])
+        out.seek(state["bytes"])
+        core.console.print(f"[cyan]Resuming export at issue {state['offset']}.[/cyan]")
+    else:
+        state = {"jql": jql, "fields": fields, "offset": 0, "bytes": 0}
+        out = open(args.export, "wb")
+
+    limit = args.limit - state["offset"]
+    try:
+        if limit > 0:
+            pages = client.iter_search_pages(jql, limit=limit, parallel=args.parallel, fields=fields, start_at=state["offset"])
+            for page in metrics.timed_pages("search", pages):
+                with metrics.phase("parse"):
+                    parsed = issue_parser.parse(page)
+                if args.epic_name:
+                    add_epic_summaries(client, config, parsed, show_progress=False)
+                out.write("".join(json.dumps(issue.to_dict(), ensure_ascii=False) + "\n" for issue in parsed).encode("utf-8"))
+                out.flush()
+                os.fsync(out.fileno())
+                state["offset"] += len(page)
+                state["bytes"] = out.tell()
+                checkpoint.save(state)
+    finally:
+        out.close()
+
+    checkpoint.remove()
+    core.console.print(f"[green]Exported {state['offset']} issues to {args.export}.[/green]")
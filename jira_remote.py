@@ -0,0 +1,69 @@
+"""
+Thin client for the jira_cli.py daemon.
+
+Sends a command line over the daemon's Unix socket and streams the output back, so
+repeated commands skip interpreter start-up, heavy imports, config parsing and cold
+caches. Start the daemon with `python jira_cli.py daemon start`. When no daemon is
+listening, the command runs through jira_cli.py directly.
+
+Usage:
+    python jira_remote.py search --jql "project = PROJ" --group-by Status
+    python jira_remote.py view PROJ-123 PROJ-124
+"""
+import os
+import sys
+import json
+import shutil
+import socket
+
+from dotenv import load_dotenv
+
+def socket_path():
+    # Same defaults as ConfigLoader, without importing jira_cli and its dependencies
+    load_dotenv()
+    path = os.getenv("JIRA_DAEMON_SOCKET")
+    if path:
+        return os.path.expanduser(path)
+    cache_dir = os.path.expanduser(os.getenv("JIRA_CACHE_DIR", "~/.cache/terminal-jira"))
+    return os.path.join(cache_dir, "daemon.sock")
+
+def run_locally(argv):
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jira_cli.py")
+    os.execv(sys.executable, [sys.executable, script] + argv)
+
+def main():
+    argv = sys.argv[1:]
+    if not hasattr(socket, "AF_UNIX"):
+        run_locally(argv)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path())
+    except OSError:
+        sock.close()
+        run_locally(argv)
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "columns": shutil.get_terminal_size().columns,
+        "tty": sys.stdout.isatty(),
+    }
+    with sock, sock.makefile("rb") as reader:
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        for line in reader:
+            frame = json.loads(line)
+            if "exit" in frame:
+                sys.stdout.flush()
+                sys.exit(frame["exit"])
+            stream = sys.stdout if frame["stream"] == "stdout" else sys.stderr
+            stream.write(frame["data"])
+            stream.flush()
+    print("Error: The daemon closed the connection.", file=sys.stderr)
+    sys.exit(1)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(130)
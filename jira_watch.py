@@ -0,0 +1,118 @@
+"""
+`search --watch`: keeps a search result current by applying only what changed between polls.
+"""
+import time
+from datetime import datetime
+
+import jira_core as core
+from jira_core import add_epic_summaries, metrics
+
+class SearchWatcher:
+    """
+    Keeps a search result and its report current for `search --watch`. Each poll asks Jira only for
+    issues updated since the newest `updated` seen so far, and patches the records and the report's
+    aggregates (a GroupByAggregator or PivotAggregator) issue by issue.
+    """
+    def __init__(self, client, config, issue_parser, jql, issues, columns=None, report=None,
+                 limit=100, parallel=None, epic_name=False):
+        self.client = client
+        self.config = config
+        self.issue_parser = issue_parser
+        self.jql = jql
+        self.columns = columns
+        self.fields = client.fields_for_columns(columns)
+        self.report = report
+        self.limit = limit
+        self.parallel = parallel
+        self.epic_name = epic_name
+        self.records = {issue.key: issue for issue in issues}
+        if report is not None:
+            report.extend(issues)
+        self.watermark = max((issue.updated for issue in issues if issue.updated), default=None)
+        self.polls = 0
+        self.last_poll = None
+        self.last_changes = (0, 0)
+
+    def poll(self):
+        """
+        Fetches and applies what changed since the last poll. Returns (issues added or updated, issues removed).
+        """
+        if self.watermark is None:
+            # Nothing has matched yet, so there is no watermark to filter on
+            changed = self.client.search_issues(self.jql, self.limit, self.parallel, self.fields, show_progress=False)
+            dropped = set()
+        else:
+            changed, dropped = self.client.fetch_changes(
+                self.jql, self.watermark, fields=self.fields, known_keys=list(self.records), parallel=self.parallel,
+                show_progress=False
+            )
+        self.polls += 1
+        self.last_poll = datetime.now()
+        self.last_changes = self.apply(changed, dropped)
+        return self.last_changes
+
+    def apply(self, changed, dropped_keys):
+        with metrics.phase("parse"):
+            parsed = self.issue_parser.parse(changed, self.columns)
+        if self.epic_name and parsed:
+            add_epic_summaries(self.client, self.config, parsed, show_progress=False)
+
+        removed = 0
+        for key in dropped_keys:
+            old = self.records.pop(key, None)
+            if old is not None:
+                self._retract(old)
+                removed += 1
+
+        updated = 0
+        for issue in parsed:
+            old = self.records.get(issue.key)
+            # The boundary minute of the watermark is always fetched again
+            if old == issue:
+                continue
+            if old is not None:
+                self._retract(old)
+            self.records[issue.key] = issue
+            if self.report is not None:
+                self.report.add(issue)
+            updated += 1
+            if issue.updated and (self.watermark is None or issue.updated > self.watermark):
+                self.watermark = issue.updated
+        return updated, removed
+
+    def _retract(self, issue):
+        if self.report is not None:
+            self.report.remove(issue)
+
+    def status(self, interval):
+        if self.last_poll is None:
+            return f"{len(self.records)} issues - polling every {interval:g}s - Ctrl+C to stop"
+        updated, removed = self.last_changes
+        return (f"{len(self.records)} issues - last poll {self.last_poll:%H:%M:%S}: {updated} updated, "
+                f"{removed} removed - polling every {interval:g}s - Ctrl+C to stop")
+
+def run_watch(watcher, interval, render):
+    """
+    Implements `search --watch`: redraws `render(watcher)` in place and polls every `interval`
+    seconds until Ctrl+C.
+    """
+    from rich.console import Group
+    from rich.live import Live
+    from rich.text import Text
+
+    def frame():
+        with metrics.phase("render"):
+            return Group(render(watcher), Text(watcher.status(interval), style="dim"))
+
+    try:
+        with Live(frame(), console=core.console, auto_refresh=False) as live:
+            while True:
+                time.sleep(interval)
+                watcher.poll()
+                live.update(frame(), refresh=True)
+    except KeyboardInterrupt:
+        pass
+
+def watch_search(args, config, client, issue_parser, jql, columns, issues, report=None):
+    return SearchWatcher(client, config, issue_parser, jql, issues, columns=columns, report=report,
+                         limit=args.limit, parallel=args.parallel, epic_name=args.epic_name)
@@ -1,7 +1,18 @@
 import unittest
 from unittest.mock import MagicMock, patch
+import io
+import json
+import argparse
 import os
-from jira_cli import ConfigLoader, JiraClient, IssueParser
+import sys
+import tempfile
+import subprocess
+import threading
+from jira_cli import ConfigLoader, JiraClient, IssueParser, IssueCache, GroupByAggregator, group_issues_pandas, split_order_by
+from jira_cli import resolve_pivot_values, build_pivot, write_issues, IssueRecord, sort_issues, run_export, ColumnarWriter
+from jira_cli import report_columns, AsyncJiraClient, Session, DaemonServer, build_parser, daemon_request
+from jira_cli import SearchWatcher, PivotAggregator, run_command
+from benchmarks.mock_jira import Dataset, MockJiraServer
 
 class TestJiraCLI(unittest.TestCase):
     def setUp(self):
@@ -45,15 +56,16 @@ class TestJiraCLI(unittest.TestCase):
         item = parsed[0]
         self.assertEqual(item["Key"], "TEST-1")
         self.assertEqual(item["Sprint"], "Sprint 1")
-        self.assertEqual(item["Points"], "5.0")
+        self.assertEqual(item["Points"], 5.0)
+        self.assertEqual(item.display("Points"), "5.0")
         self.assertEqual(item["Epic Link"], "EPIC-1")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_client_search(self, mock_get):
         # Mock API response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "issues": [
                  {
                 "key": "TEST-1",
@@ -70,7 +82,7 @@ class TestJiraCLI(unittest.TestCase):
             }
             ],
             "total": 1
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         client = JiraClient(self.config)
@@ -79,5 +91,579 @@ class TestJiraCLI(unittest.TestCase):
         self.assertEqual(len(issues), 1)
         self.assertEqual(issues[0]["key"], "TEST-1")
 
+    @patch('requests.Session.get')
+    def test_client_search_parallel_pages(self, mock_get):
+        total = 250
+
+        def page(url, params=None, **kwargs):
+            start = params["startAt"]
+            count = min(params["maxResults"], total - start)
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({
+                "issues": [{"key": f"TEST-{i}", "fields": {}} for i in range(start, start + count)],
+                "total": total
+            }).encode()
+            return response
+
+        mock_get.side_effect = page
+
+        client = JiraClient(self.config)
+        issues = client.search_issues("project = TEST", limit=1000, parallel=3)
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual([i["key"] for i in issues], [f"TEST-{i}" for i in range(total)])
+
+    def test_search_against_mock_server(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(250), throttle_rate=0.2, retry_after=0).start()
+        try:
+            self.config.jira_url = server.url
+            client = JiraClient(self.config)
+            issues = client.search_issues('project = PROJ AND status != "Done" ORDER BY key', limit=1000, parallel=3)
+            expected = [k for k in (f"PROJ-{i}" for i in range(1, 251))
+                        if server.dataset.issue(server.dataset.index_of(k))["fields"]["status"]["name"] != "Done"]
+            self.assertEqual([i["key"] for i in issues], expected)
+
+            stats = server.stats()
+            # One request per 100-issue page, plus retried 429s
+            self.assertGreaterEqual(stats["requests"]["search"], (len(expected) + 99) // 100)
+
+            results = client.edit_issues_bulk([i["key"] for i in issues[:5]], {"summary": "Edited"})
+            self.assertEqual([error for _, error in results], [None] * 5)
+            self.assertEqual(client.get_issue(issues[0]["key"])["fields"]["summary"], "Edited")
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_watch_applies_only_changes(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(400)).start()
+        try:
+            self.config.jira_url = server.url
+            client = JiraClient(self.config)
+            parser = IssueParser(self.config)
+            jql = 'project = PROJ AND status != "Done"'
+            columns = {"Key", "Points", "Status", "Assignee", "Updated"}
+            fields = client.fields_for_columns(columns)
+            issues = parser.parse(client.search_issues(jql, limit=1000, fields=fields), columns)
+            values = [("Count", "Key", "count"), ("Points", "Points", "sum")]
+
+            grouped = GroupByAggregator(["Status"])
+            watcher = SearchWatcher(client, self.config, parser, jql, issues, columns=columns, report=grouped, limit=1000)
+            pivot = PivotAggregator("Assignee", "Status", values)
+            pivot.extend(issues)
+
+            keys = list(watcher.records)
+            server.dataset.update(server.dataset.index_of(keys[0]), {"status": {"name": "Done"}})
+            server.dataset.update(server.dataset.index_of(keys[1]), {"status": {"name": "Blocked"}, "customfield_10006": 8.0})
+            server.reset_stats()
+
+            updated, removed = watcher.poll()
+            self.assertEqual(removed, 1)
+            self.assertGreaterEqual(updated, 1)
+            # One page of changes and one page of removals, however many issues are watched
+            self.assertEqual(server.stats()["total_requests"], 2)
+            self.assertNotIn(keys[0], watcher.records)
+            self.assertEqual(watcher.records[keys[1]].status, "Blocked")
+
+            fresh = parser.parse(client.search_issues(jql, limit=1000, fields=fields), columns)
+            expected = GroupByAggregator(["Status"])
+            expected.extend(fresh)
+            self.assertEqual(grouped.rows(), expected.rows())
+            self.assertEqual(sorted(watcher.records), sorted(i.key for i in fresh))
+
+            # Nothing changed since: the boundary minute comes back but nothing is applied
+            self.assertEqual(watcher.poll(), (0, 0))
+
+            for issue in issues:
+                pivot.remove(issue)
+            pivot.extend(watcher.records.values())
+            expected_pivot = build_pivot(fresh, "Assignee", "Status", values)
+            frame = pivot.frame()
+            self.assertEqual(list(frame.index), list(expected_pivot.index))
+            self.assertEqual(list(frame.columns), list(expected_pivot.columns))
+            self.assertEqual(frame.to_numpy(dtype=float).tolist(), expected_pivot.to_numpy(dtype=float).tolist())
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_watch_keeps_up_with_churn_beyond_limit(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(600)).start()
+        try:
+            self.config.jira_url = server.url
+            client = JiraClient(self.config)
+            parser = IssueParser(self.config)
+            jql = 'project = PROJ AND status != "Done"'
+            columns = {"Key", "Points", "Status", "Updated"}
+            fields = client.fields_for_columns(columns)
+            issues = parser.parse(client.search_issues(jql, limit=100, fields=fields), columns)
+            grouped = GroupByAggregator(["Status"])
+            watcher = SearchWatcher(client, self.config, parser, jql, issues, columns=columns, report=grouped, limit=100)
+
+            dataset = server.dataset
+            watched = list(watcher.records)
+            outside = [i for i in range(dataset.count()) if dataset.issue(i)["key"] not in watcher.records]
+            # 150 unrelated updates, 120 point changes on watched issues and one watched issue moved to Done
+            for index in outside[:150]:
+                dataset.update(index, {"summary": "Touched"})
+            for key in watched[:60]:
+                dataset.update(dataset.index_of(key), {dataset.field_story_points: 13.0})
+            for key in watched[:60]:
+                dataset.update(dataset.index_of(key), {dataset.field_story_points: 21.0})
+            dataset.update(dataset.index_of(watched[70]), {"status": {"name": "Done"}})
+
+            updated, removed = watcher.poll()
+            self.assertEqual(removed, 1)
+            self.assertNotIn(watched[70], watcher.records)
+            self.assertTrue(all(watcher.records[key].points == 21.0 for key in watched[:60]))
+
+            # Every watched issue matches the server, and the counts match the watched issues
+            fresh = {i.key: i for i in parser.parse(client.get_issues(list(watcher.records), fields=fields).values(), columns)}
+            for key, record in watcher.records.items():
+                self.assertEqual((record.status, record.points), (fresh[key].status, fresh[key].points))
+            expected = GroupByAggregator(["Status"])
+            expected.extend(watcher.records.values())
+            self.assertEqual(grouped.rows(), expected.rows())
+            self.assertEqual(watcher.poll(), (0, 0))
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_async_client_against_mock_server(self):
+        import asyncio
+
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(450), throttle_rate=0.1, retry_after=0).start()
+        self.config.jira_url = server.url
+
+        async def scenario():
+            async with AsyncJiraClient(self.config, concurrency=3) as jira:
+                issues = await jira.search_issues("project = PROJ", limit=430)
+                epics = await jira.resolve_epic_summaries(i["fields"]["customfield_10000"] for i in issues)
+                edits = await jira.edit_issues_bulk(["PROJ-1", "PROJ-2", "PROJ-999"], {"summary": "Async"})
+                issue = await jira.get_issue("PROJ-2")
+                return issues, epics, edits, issue
+
+        try:
+            issues, epics, edits, issue = asyncio.run(scenario())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual([i["key"] for i in issues], [f"PROJ-{n}" for n in range(1, 431)])
+        self.assertTrue(epics["PROJ-1"].startswith("Epic 1:"))
+        self.assertEqual([error is None for _, error in edits], [True, True, False])
+        self.assertEqual(issue["fields"]["summary"], "Async")
+
+    def test_session_reuses_warm_client(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(300)).start()
+        with tempfile.TemporaryDirectory() as tmp:
+            self.config.jira_url = server.url
+            self.config.cache_dir = tmp
+            self.config.daemon_socket = os.path.join(tmp, "daemon.sock")
+            session = Session(self.config, build_parser())
+            try:
+                argv = ["search", "--jql", "project = PROJ", "--limit", "300", "--format", "tsv"]
+                with patch("sys.stdout", new_callable=io.StringIO) as out:
+                    self.assertEqual(session.run(argv), 0)
+                requests_made = server.stats()["total_requests"]
+                self.assertEqual(out.getvalue().count("\n"), 301)
+
+                # A repeat within JIRA_SESSION_FRESHNESS is answered from the open issue cache
+                with patch("sys.stdout", new_callable=io.StringIO) as out:
+                    self.assertEqual(session.run(argv), 0)
+                self.assertEqual(server.stats()["total_requests"], requests_made)
+                self.assertEqual(out.getvalue().count("\n"), 301)
+
+                session.client.epic_cache.update({"PROJ-1": "Error", "PROJ-2": "Epic 2"})
+                with patch("sys.stdout", new_callable=io.StringIO):
+                    self.assertEqual(session.run(argv), 0)
+                self.assertEqual(session.client.epic_cache, {"PROJ-2": "Epic 2"})
+
+                self.assertEqual(session.run(["search", "--bogus"]), 2)
+                self.assertEqual(session.run(["shell"]), 1)
+
+                # The daemon serves the same session over a Unix socket
+                daemon = DaemonServer(self.config.daemon_socket, session, idle_timeout=5)
+                thread = threading.Thread(target=daemon.serve_until_stopped)
+                thread.start()
+                try:
+                    status = daemon_request(self.config.daemon_socket, {"control": "status"})
+                    self.assertEqual(status["status"]["commands"], 3)
+                    self.assertEqual(daemon_request(self.config.daemon_socket, {"control": "stop"}), {"stopped": True})
+                finally:
+                    daemon.running = False
+                    thread.join(10)
+                self.assertFalse(os.path.exists(self.config.daemon_socket))
+            finally:
+                session.close()
+                server.shutdown()
+                server.server_close()
+
+    @patch('requests.Session.get')
+    def test_iter_search_pages_is_lazy(self, mock_get):
+        def page(url, params=None, **kwargs):
+            start = params["startAt"]
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({
+                "issues": [{"key": f"TEST-{i}", "fields": {}} for i in range(start, start + params["maxResults"])],
+                "total": 1000
+            }).encode()
+            return response
+
+        mock_get.side_effect = page
+
+        client = JiraClient(self.config)
+        pages = client.iter_search_pages("project = TEST", limit=1000, parallel=2, show_progress=False)
+        first = next(pages)
+        self.assertEqual(mock_get.call_count, 1)
+        second = next(pages)
+        # First page, the page just handed over, and at most `parallel` in flight
+        self.assertLessEqual(mock_get.call_count, 4)
+        self.assertEqual((first[0]["key"], second[0]["key"]), ("TEST-0", "TEST-100"))
+        self.assertEqual(sum(len(p) for p in pages) + 200, 1000)
+
+    def test_write_issues_tsv(self):
+        out = io.StringIO()
+        write_issues([IssueRecord("T-1", type="Bug", summary="a\tb", status="Done")], "tsv", out=out)
+        write_issues([IssueRecord("T-2", type="Task", summary="c", status="To Do", points=3.0)], "tsv", header=False, out=out)
+        self.assertEqual(out.getvalue(), (
+            "Key\tType\tSummary\tStatus\tPriority\tAssignee\tSprint\tPoints\tEpic Link\n"
+            "T-1\tBug\ta b\tDone\tNone\tUnassigned\t\t\t\n"
+            "T-2\tTask\tc\tTo Do\tNone\tUnassigned\t\t3.0\t\n"
+        ))
+
+    def test_issue_record_sort_and_columns(self):
+        issues = [IssueRecord("T-1", points=8.0), IssueRecord("T-2"), IssueRecord("T-3", points=2.0)]
+        sort_issues(issues, "points")
+        self.assertEqual([i.key for i in issues], ["T-3", "T-1", "T-2"])
+
+        self.assertNotIn("Epic Summary", issues[0])
+        issues[0]["Epic Summary"] = "Payments"
+        self.assertEqual(issues[0].get("Epic Summary"), "Payments")
+        self.assertEqual(issues[0].keys()[-1], "Epic Summary")
+
+    @patch('requests.Session.get')
+    def test_export_resumes_from_checkpoint(self, mock_get):
+        total = 300
+        interrupted = []
+
+        def page(url, params=None, **kwargs):
+            start = params["startAt"]
+            self.assertTrue(params["jql"].endswith("ORDER BY key ASC"))
+            if start == 200 and not interrupted:
+                interrupted.append(start)
+                raise KeyboardInterrupt
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({
+                "issues": [{"key": f"TEST-{i}", "fields": {}} for i in range(start, min(start + params["maxResults"], total))],
+                "total": total
+            }).encode()
+            return response
+
+        mock_get.side_effect = page
+        client = JiraClient(self.config)
+        parser = IssueParser(self.config)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.jsonl")
+            args = argparse.Namespace(export=path, resume=True, limit=1000, parallel=1, epic_name=False)
+            with self.assertRaises(KeyboardInterrupt):
+                run_export(args, self.config, client, parser, "project = TEST")
+            with open(f"{path}.checkpoint") as f:
+                self.assertEqual(json.load(f)["offset"], 200)
+
+            run_export(args, self.config, client, parser, "project = TEST")
+
+            with open(path) as f:
+                keys = [json.loads(line)["Key"] for line in f]
+            self.assertEqual(keys, [f"TEST-{i}" for i in range(total)])
+            self.assertFalse(os.path.exists(f"{path}.checkpoint"))
+
+    def _records(self):
+        return [
+            IssueRecord("T-1", status="Done", points=3.0, created="2024-01-31T10:15:00.000+0100"),
+            IssueRecord("T-2", status="To Do", updated="2024-02-01T08:00:00.000+0000"),
+        ]
+
+    def test_columnar_writer_csv_without_pyarrow(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.csv")
+            writer = ColumnarWriter(path)
+            writer.pa = None
+            writer.write(self._records())
+            writer.close()
+            with open(path) as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(lines[0], "Key,Type,Summary,Status,Priority,Assignee,Sprint,Points,Epic Link,Created,Updated")
+        self.assertEqual(lines[1], "T-1,,,Done,None,Unassigned,,3.0,,2024-01-31T09:15:00+00:00,")
+
+    def test_columnar_writer_parquet(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.parquet")
+            writer = ColumnarWriter(path, row_group_size=1)
+            writer.write(self._records())
+            writer.close()
+            table = pq.read_table(path)
+
+        self.assertEqual(str(table.schema.field("Points").type), "double")
+        self.assertEqual(str(table.schema.field("Created").type), "timestamp[ms, tz=UTC]")
+        self.assertEqual(table.column("Points").to_pylist(), [3.0, None])
+
+    def test_split_order_by(self):
+        self.assertEqual(split_order_by("project = TEST order by rank ASC"), ("project = TEST", " order by rank ASC"))
+        self.assertEqual(split_order_by("project = TEST"), ("project = TEST", ""))
+
+    def test_sync_issues_incremental(self):
+        def issue(key, status, updated):
+            return {"key": key, "fields": {"status": {"name": status}, "updated": updated}}
+
+        client = JiraClient(self.config)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = IssueCache(os.path.join(tmp, "issues.db"))
+
+            with patch.object(client, "iter_search_pages", return_value=iter([[
+                issue("TEST-1", "To Do", "2024-01-01T10:00:00.000+0000"),
+                issue("TEST-2", "To Do", "2024-01-01T11:30:00.000+0000"),
+            ]])):
+                client.sync_issues("project = TEST ORDER BY key", cache, limit=50)
+
+            # TEST-2 left the result, TEST-3 is new and TEST-1 is unchanged
+            listing = [
+                issue("TEST-1", None, "2024-01-01T10:00:00.000+0000"),
+                issue("TEST-3", None, "2024-01-02T08:00:00.000+0000"),
+            ]
+            with patch.object(client, "search_issues", return_value=listing) as search, \
+                 patch.object(client, "get_issues", return_value={"TEST-3": issue("TEST-3", "To Do", "2024-01-02T08:00:00.000+0000")}) as fetch:
+                issues = client.sync_issues("project = TEST ORDER BY key", cache, limit=50)
+
+            self.assertEqual(search.call_args.kwargs["fields"], ["key", "updated"])
+            self.assertEqual(fetch.call_args.args[0], ["TEST-3"])
+            self.assertEqual([i["key"] for i in issues], ["TEST-1", "TEST-3"])
+            self.assertEqual(issues[0]["fields"]["status"]["name"], "To Do")
+
+            offline = client.sync_issues("project = TEST ORDER BY key", cache, limit=50, offline=True)
+            self.assertEqual([i["key"] for i in offline], ["TEST-1", "TEST-3"])
+            cache.close()
+
+    def _synced_keys(self, client, cache, jql, limit):
+        return [i["key"] for i in client.sync_issues(jql, cache, limit=limit)]
+
+    def test_sync_shows_new_issue_first_under_order_by(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(300)).start()
+        try:
+            self.config.jira_url = server.url
+            client = JiraClient(self.config)
+            jql = "project = PROJ ORDER BY created DESC"
+            with tempfile.TemporaryDirectory() as tmp:
+                cache = IssueCache(os.path.join(tmp, "issues.db"))
+                self.assertEqual(self._synced_keys(client, cache, jql, 10)[0], "PROJ-300")
+
+                server.dataset.create({"summary": "New", "status": {"name": "To Do"}})
+                warm = self._synced_keys(client, cache, jql, 10)
+                self.assertEqual(warm, [i["key"] for i in client.search_issues(jql, limit=10)])
+                self.assertEqual(warm[0], "PROJ-301")
+                cache.close()
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_sync_notices_removal_behind_unrelated_churn(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(400)).start()
+        try:
+            self.config.jira_url = server.url
+            client = JiraClient(self.config)
+            jql = 'project = PROJ AND status != "Done" ORDER BY key'
+            with tempfile.TemporaryDirectory() as tmp:
+                cache = IssueCache(os.path.join(tmp, "issues.db"))
+                cold = self._synced_keys(client, cache, jql, 50)
+
+                dataset = server.dataset
+                done = [i for i in range(dataset.count()) if dataset.issue(i)["fields"]["status"]["name"] == "Done"]
+                for index in done[:60]:
+                    dataset.update(index, {"summary": "Touched"})
+                dataset.update(dataset.index_of(cold[5]), {"status": {"name": "Done"}})
+                dataset.update(dataset.index_of(cold[6]), {"customfield_10006": 21.0})
+
+                warm = client.sync_issues(jql, cache, limit=50)
+                self.assertNotIn(cold[5], [i["key"] for i in warm])
+                self.assertEqual([i["key"] for i in warm], [i["key"] for i in client.search_issues(jql, limit=50)])
+                self.assertEqual(warm[5]["fields"]["customfield_10006"], 21.0)
+                cache.close()
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_field_projection_for_group_by(self):
+        args = argparse.Namespace(group_by="status,ASSIGNEE", pivot_rows=None, pivot_cols=None, pivot_values="Points",
+                                  sort=None, epic_name=False, output=None)
+        columns = report_columns(args)
+        self.assertEqual(columns, {"Key", "Points", "Status", "Assignee"})
+
+        client = JiraClient(self.config)
+        self.assertEqual(client.fields_for_columns(columns), ["key", "status", "assignee", self.config.field_story_points])
+
+        raw = [{"key": "T-1", "fields": {"status": {"name": "Done"}, "summary": "Skipped",
+                                        "assignee": {"displayName": "Ann"}, self.config.field_story_points: 3}}]
+        record = IssueParser(self.config).parse(raw, columns)[0]
+        self.assertEqual((record.status, record.assignee, record.points), ("Done", "Ann", 3.0))
+        self.assertIsNone(record.summary)
+
+        args.group_by = None
+        self.assertIsNone(report_columns(args))
+
+    def test_invalid_group_by_falls_back_to_full_table(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(50)).start()
+        try:
+            self.config.jira_url = server.url
+            self.config.issue_cache = False
+            args = build_parser().parse_args(["search", "--jql", "project = PROJ", "--group-by", "Foo", "--format", "jsonl"])
+            self.assertIsNone(report_columns(args))
+
+            client = JiraClient(self.config)
+            with patch("sys.stdout", new_callable=io.StringIO) as out, patch("jira_cli.console"):
+                run_command(args, self.config, client, IssueParser(self.config))
+            rows = [json.loads(line) for line in out.getvalue().splitlines()]
+            expected = server.dataset.issue(0)["fields"]
+            self.assertEqual(len(rows), 50)
+            self.assertEqual((rows[0]["Type"], rows[0]["Status"], rows[0]["Priority"]),
+                             (expected["issuetype"]["name"], expected["status"]["name"], expected["priority"]["name"]))
+            self.assertTrue(all(row["Summary"] for row in rows))
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_sync_refetches_when_fields_widen(self):
+        client = JiraClient(self.config)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = IssueCache(os.path.join(tmp, "issues.db"))
+            first = [{"key": "T-1", "fields": {"status": {"name": "Done"}, "updated": "2024-01-01T10:00:00.000+0000"}}]
+            with patch.object(client, "iter_search_pages", return_value=iter([first])):
+                client.sync_issues("project = T", cache, fields=["key", "status"])
+            self.assertEqual(cache.get_query("project = T")["fields"], ["key", "status", "updated"])
+
+            second = [{"key": "T-1", "fields": {"summary": "Hello", "updated": "2024-01-01T10:00:00.000+0000"}}]
+            with patch.object(client, "iter_search_pages", return_value=iter([second])) as search:
+                client.sync_issues("project = T", cache, fields=["key", "summary"])
+            self.assertEqual(search.call_args.kwargs["fields"], ["key", "summary", "updated", "status"])
+
+            merged = cache.get_issues(["T-1"])[0]["fields"]
+            self.assertEqual((merged["status"]["name"], merged["summary"]), ("Done", "Hello"))
+            cache.close()
+
+    def test_offline_refuses_fields_missing_from_cache(self):
+        client = JiraClient(self.config)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = IssueCache(os.path.join(tmp, "issues.db"))
+            first = [{"key": "T-1", "fields": {"status": {"name": "Done"}, "updated": "2024-01-01T10:00:00.000+0000"}}]
+            with patch.object(client, "iter_search_pages", return_value=iter([first])):
+                client.sync_issues("project = T", cache, fields=["key", "status"])
+
+            self.assertEqual(len(client.sync_issues("project = T", cache, offline=True, fields=["key", "status"])), 1)
+            with patch("jira_cli.console") as console, self.assertRaises(SystemExit):
+                client.sync_issues("project = T", cache, offline=True, fields=["key", "assignee"])
+            self.assertIn("lack the fields assignee", console.print.call_args.args[0])
+            cache.close()
+
+    def test_group_by_backends_agree(self):
+        issues = [
+            IssueRecord("T-1", status="Done", assignee="Ann", points=3.0),
+            IssueRecord("T-2", status="Done", assignee="Bob"),
+            IssueRecord("T-3", status="To Do", assignee="Ann", points=5.0),
+            IssueRecord("T-4", status="Done", assignee="Ann"),
+            IssueRecord("T-5", status=None, assignee="Ann", points=8.0),
+        ]
+        aggregator = GroupByAggregator(["Status", "Assignee"])
+        aggregator.extend(issues)
+
+        expected = [(("To Do", "Ann"), 1, 5.0), (("Done", "Ann"), 2, 3.0), (("Done", "Bob"), 1, 0.0)]
+        self.assertEqual(aggregator.rows(), expected)
+        self.assertEqual(group_issues_pandas(issues, ["Status", "Assignee"]), expected)
+
+    def test_group_by_streams_pages_into_aggregator(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(250)).start()
+        try:
+            self.config.jira_url = server.url
+            self.config.issue_cache = False
+            args = build_parser().parse_args(["search", "--jql", "project = PROJ", "--limit", "250", "--group-by", "status"])
+            client = JiraClient(self.config)
+            expected = GroupByAggregator(["Status"])
+            expected.extend(IssueParser(self.config).parse(client.search_issues("project = PROJ", limit=250, show_progress=False)))
+
+            with patch("jira_cli.display_grouped") as display, patch("jira_cli.console"), \
+                    patch.object(GroupByAggregator, "extend", autospec=True, side_effect=GroupByAggregator.extend) as extend:
+                with self.assertRaises(SystemExit):
+                    run_command(args, self.config, client, IssueParser(self.config))
+            # One call per search page, never the whole result at once
+            self.assertEqual([len(call.args[1]) for call in extend.call_args_list], [100, 100, 50])
+            self.assertEqual(display.call_args.args, (["Status"], expected.rows()))
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_pivot_streams_pages_into_aggregator(self):
+        server = MockJiraServer(("127.0.0.1", 0), Dataset(250)).start()
+        try:
+            self.config.jira_url = server.url
+            self.config.issue_cache = False
+            args = build_parser().parse_args(["search", "--jql", "project = PROJ", "--limit", "250",
+                                              "--pivot-rows", "Assignee", "--pivot-cols", "Status", "--pivot-values", "Count,Points"])
+            client = JiraClient(self.config)
+            issues = IssueParser(self.config).parse(client.search_issues("project = PROJ", limit=250, show_progress=False))
+            values = resolve_pivot_values("Count,Points", {c.lower(): c for c in IssueRecord.COLUMNS})
+            expected = build_pivot(issues, "Assignee", "Status", values)
+
+            with patch("jira_cli.display_pivot") as display, patch("jira_cli.console"), \
+                    patch.object(PivotAggregator, "extend", autospec=True, side_effect=PivotAggregator.extend) as extend:
+                with self.assertRaises(SystemExit):
+                    run_command(args, self.config, client, IssueParser(self.config))
+            self.assertEqual([len(call.args[1]) for call in extend.call_args_list], [100, 100, 50])
+            pivot = display.call_args.args[0]
+            self.assertEqual(list(pivot.index), list(expected.index))
+            self.assertEqual(list(pivot.columns), list(expected.columns))
+            self.assertEqual(pivot.to_numpy(dtype=float).tolist(), expected.to_numpy(dtype=float).tolist())
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_pivot_multiple_values(self):
+        issues = [
+            IssueRecord("T-1", status="Done", assignee="Ann", points=3.0),
+            IssueRecord("T-2", status="To Do", assignee="Ann", points=5.0),
+            IssueRecord("T-3", status="Done", assignee="Bob"),
+        ]
+        values = resolve_pivot_values("Count,points", {c.lower(): c for c in issues[0].keys()})
+        self.assertEqual(values, [("Count", "Key", "count"), ("Points", "Points", "sum")])
+
+        pivot = build_pivot(issues, "Assignee", "Status", values)
+        self.assertEqual(list(pivot.columns), [
+            ("Count", "Done"), ("Points", "Done"), ("Count", "To Do"), ("Points", "To Do"),
+            ("Count", "Total"), ("Points", "Total"),
+        ])
+        self.assertEqual(pivot.loc["Ann"].tolist(), [1, 3.0, 1, 5.0, 2, 8.0])
+        self.assertEqual(pivot.loc["Total"].tolist(), [2, 3.0, 1, 5.0, 3, 8.0])
+
+    def test_import_does_not_load_pandas(self):
+        # Run in a fresh interpreter: other tests may already have imported pandas
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, jira_cli; print('pandas' in sys.modules)"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,19 @@
 import unittest
 from unittest.mock import MagicMock, patch
+import io
 import os
+import json
+import argparse
 import sys
+import time
+import tempfile
+import requests
 
 # Add current dir to path to find jira_cli
 sys.path.append(os.getcwd())
 
-from jira_cli import ConfigLoader, JiraClient
+from jira_cli import ConfigLoader, JiraClient, SummaryCache, decode_sprint, load_bulk_rows, parse_retry_after, TokenBucket
+from jira_cli import endpoint_label, metrics, run_bulk_edit, display_connection_stats
 
 class TestJiraCLIV2(unittest.TestCase):
     def setUp(self):
@@ -18,7 +25,7 @@ class TestJiraCLIV2(unittest.TestCase):
         self.config = ConfigLoader()
         self.client = JiraClient(self.config)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_create_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -41,7 +48,55 @@ class TestJiraCLIV2(unittest.TestCase):
         self.assertIn("/rest/api/2/issue", args[0])
         self.assertEqual(kwargs["json"]["fields"]["summary"], "New Issue")
 
-    @patch('requests.put')
+    @patch('requests.Session.post')
+    def test_create_issues_bulk(self, mock_post):
+        def bulk(url, json=None, **kwargs):
+            updates = json["issueUpdates"]
+            response = MagicMock()
+            response.status_code = 201
+            # The second element of every chunk is rejected
+            response.json.return_value = {
+                "issues": [{"key": f"NEW-{u['fields']['summary']}"} for i, u in enumerate(updates) if i != 1],
+                "errors": [{
+                    "status": 400, "failedElementNumber": 1,
+                    "elementErrors": {"errorMessages": [], "errors": {"issuetype": "invalid"}}
+                }]
+            }
+            return response
+
+        mock_post.side_effect = bulk
+        fields = [{"summary": str(i)} for i in range(60)]
+        results = self.client.create_issues_bulk(fields, parallel=2)
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertIn("/rest/api/2/issue/bulk", mock_post.call_args.args[0])
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[0], ("NEW-0", None))
+        self.assertEqual(results[1], (None, "issuetype: invalid"))
+        self.assertEqual(results[51], (None, "issuetype: invalid"))
+        self.assertEqual(results[59], ("NEW-59", None))
+
+    def test_load_bulk_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Summary,Issue Type,Story Points,Epic Link,Sprint\nFirst,Story,3,EPIC-1,\nSecond,Bug,,,Sprint 5\n")
+            rows = load_bulk_rows(path)
+
+        self.assertEqual(rows, [
+            {"summary": "First", "type": "Story", "points": "3", "epic_link": "EPIC-1"},
+            {"summary": "Second", "type": "Bug", "sprint": "Sprint 5"},
+        ])
+
+    def test_load_bulk_rows_rejects_non_object_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"summary": "First"}\n\n[1, 2]\n')
+            with self.assertRaisesRegex(ValueError, "line 3: expected a JSON object, got list"):
+                load_bulk_rows(path)
+
+    @patch('requests.Session.put')
     def test_edit_issue(self, mock_put):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -57,14 +112,62 @@ class TestJiraCLIV2(unittest.TestCase):
         self.assertIn("/rest/api/2/issue/TEST-100", args[0])
         self.assertEqual(kwargs["json"]["fields"]["summary"], "Updated Summary")
 
-    @patch('requests.put')
-    @patch('requests.get')
+    @patch('time.sleep')
+    @patch('requests.Session.put')
+    def test_edit_issues_bulk_retries_429(self, mock_put, mock_sleep):
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "3"})
+        ok = MagicMock(status_code=204)
+        failed = MagicMock(status_code=400, text="bad field")
+
+        def put(url, json=None, **kwargs):
+            if url.endswith("TEST-2"):
+                return failed
+            if url.endswith("TEST-1") and mock_put.call_count == 1:
+                return throttled
+            return ok
+
+        mock_put.side_effect = put
+        results = self.client.edit_issues_bulk(["TEST-1", "TEST-2", "TEST-3"], {"summary": "x"}, parallel=1)
+
+        self.assertEqual(results, [("TEST-1", None), ("TEST-2", "HTTP 400: bad field"), ("TEST-3", None)])
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_transport_gives_up_on_long_retry_after(self, mock_get, mock_sleep):
+        mock_get.return_value = MagicMock(status_code=429, headers={"Retry-After": "3600"})
+        response = self.client._request("GET", "https://mock.jira.com/rest/api/2/issue/TEST-1")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(mock_get.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
+    def test_bulk_edit_refuses_truncated_match(self, mock_get, mock_put):
+        issues = [{"key": f"TEST-{i}", "fields": {"summary": "s", "status": {"name": "To Do"}}} for i in range(2)]
+        mock_get.return_value = MagicMock(status_code=200, content=json.dumps({"total": 1500, "issues": issues}).encode())
+        args = argparse.Namespace(jql="project = TEST", limit=2, dry_run=True, parallel=1)
+
+        with patch("jira_cli.console") as console:
+            run_bulk_edit(args, self.client, {"summary": "x"})
+        printed = " ".join(str(call.args[0]) for call in console.print.call_args_list if call.args)
+        self.assertIn("1500 issues match", printed)
+        self.assertEqual(console.print.call_args_list[1].args[0].title, "Dry run: 2 of 1500 matching issues would be updated")
+
+        args.dry_run = False
+        with patch("jira_cli.console"), self.assertRaises(SystemExit):
+            run_bulk_edit(args, self.client, {"summary": "x"})
+        mock_put.assert_not_called()
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
     def test_edit_sprint(self, mock_get, mock_put):
         # Mock Search for Sprint Resolution
         mock_search_response = MagicMock()
         mock_search_response.status_code = 200
         # Mock issue with sprint field
-        mock_search_response.json.return_value = {
+        mock_search_response.content = json.dumps({
             "issues": [{
                 "fields": {
                     "customfield_10004": [
@@ -72,7 +175,7 @@ class TestJiraCLIV2(unittest.TestCase):
                     ]
                 }
             }]
-        }
+        }).encode()
         mock_get.return_value = mock_search_response
         
         # Mock Edit
@@ -84,5 +187,206 @@ class TestJiraCLIV2(unittest.TestCase):
         sprint_id = self.client.get_sprint_id("Sprint X")
         self.assertEqual(sprint_id, 999)
 
+    @patch('requests.Session.get')
+    def test_sprint_index_from_board(self, mock_get):
+        board_sprints = [{"id": 10 + i, "name": f"Sprint {i}", "state": "closed"} for i in range(60)]
+
+        def page(url, params=None, **kwargs):
+            start = params["startAt"]
+            values = board_sprints[start:start + params["maxResults"]]
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({"values": values, "isLast": start + len(values) >= len(board_sprints)}).encode()
+            return response
+
+        mock_get.side_effect = page
+        with tempfile.TemporaryDirectory() as tmp:
+            self.config.board_ids = ["7"]
+            self.config.cache_dir = tmp
+            self.assertEqual(self.client.get_sprint_id("Sprint 55"), 65)
+            self.assertIn("/rest/agile/1.0/board/7/sprint", mock_get.call_args.args[0])
+            self.assertEqual(mock_get.call_count, 2)
+
+            # A new client reads the index from disk
+            client = JiraClient(self.config)
+            self.assertEqual(client.get_sprint_id("Sprint 3"), 13)
+            self.assertEqual(mock_get.call_count, 2)
+
+            # A miss refreshes the index once, picking up newly created sprints
+            board_sprints.append({"id": 500, "name": "Sprint Next", "state": "future"})
+            self.assertEqual(client.get_sprint_id("Sprint Next"), 500)
+            self.assertEqual(mock_get.call_count, 4)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_transport_retries_transient_errors(self, mock_get, mock_sleep):
+        ok = MagicMock(status_code=200)
+        ok.content = json.dumps({"issues": [{"key": "TEST-1", "fields": {}}], "total": 1}).encode()
+        mock_get.side_effect = [
+            MagicMock(status_code=503, headers={}),
+            requests.exceptions.ConnectionError("reset"),
+            MagicMock(status_code=429, headers={"Retry-After": "2"}),
+            ok,
+        ]
+
+        issues = self.client.search_issues("project = TEST")
+
+        self.assertEqual([i["key"] for i in issues], ["TEST-1"])
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertEqual(mock_sleep.call_args_list[-1].args, (2.0,))
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_request_metrics(self, mock_get, mock_sleep):
+        self.assertEqual(endpoint_label("get", "https://jira/rest/api/2/issue/PROJ-12?expand=x"), "GET /rest/api/2/issue/{key}")
+        self.assertEqual(endpoint_label("GET", "https://jira/rest/agile/1.0/board/7/sprint"), "GET /rest/agile/1.0/board/{id}/sprint")
+
+        ok = MagicMock(status_code=200, headers={"Content-Length": "120"})
+        ok.content = json.dumps({"issues": [{"key": "TEST-1", "fields": {}}], "total": 1}).encode()
+        mock_get.side_effect = [MagicMock(status_code=429, headers={"Retry-After": "0"}), ok]
+
+        metrics.reset()
+        with metrics.phase("search"):
+            self.client.search_issues("project = TEST")
+        snapshot = metrics.snapshot()
+
+        search = snapshot["http"]["GET /rest/api/2/search"]
+        self.assertEqual((search["requests"], search["retries"], search["bytes"]), (2, 1, 120))
+        self.assertEqual(search["statuses"], {"429": 1, "200": 1})
+        self.assertEqual(sum(search["latency_histogram"].values()), 2)
+        self.assertEqual(snapshot["phases"]["search"]["calls"], 1)
+
+        metrics.record_cache("summary_cache", hits=3, misses=1)
+        self.assertEqual(metrics.snapshot()["caches"]["summary_cache"]["hit_rate"], 0.75)
+
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    def test_transport_does_not_retry_failed_post(self, mock_post, mock_sleep):
+        mock_post.return_value = MagicMock(status_code=503, text="unavailable")
+        self.assertIsNone(self.client.create_issue({"summary": "x"}))
+        self.assertEqual(mock_post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_connection_stats_go_to_stderr(self):
+        with patch("sys.stdout", new_callable=io.StringIO) as out, patch("sys.stderr", new_callable=io.StringIO) as err:
+            display_connection_stats({"requests": 12, "opened": 1, "reused": 11})
+        self.assertEqual(out.getvalue(), "")
+        self.assertIn("HTTP Connections", err.getvalue())
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=200, capacity=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+    def test_decode_sprint(self):
+        raw = ("com.atlassian.greenhopper.service.sprint.Sprint@1f2e[id=42,rapidViewId=7,state=CLOSED,"
+               "name=Sprint 12, Team A,startDate=2024-01-01T09:00:00.000Z,endDate=2024-01-14T17:00:00.000Z,"
+               "completeDate=<null>,sequence=42]")
+        sprint = decode_sprint(raw)
+        self.assertEqual(sprint.id, 42)
+        self.assertEqual(sprint.name, "Sprint 12, Team A")
+        self.assertEqual(sprint.state, "CLOSED")
+        self.assertEqual(sprint.start_date, "2024-01-01T09:00:00.000Z")
+        self.assertIsNone(sprint.complete_date)
+        self.assertIs(decode_sprint(raw), sprint)
+
+        self.assertEqual(decode_sprint({"id": 5, "name": "Sprint 5", "state": "active"}).id, 5)
+
+    @patch('requests.Session.get')
+    def test_resolve_epic_summaries(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "issues": [{"key": "EPIC-1", "fields": {"summary": "Payments"}}]
+        }).encode()
+        mock_get.return_value = mock_response
+
+        cache = self.client.resolve_epic_summaries(["EPIC-1", "EPIC-2", "EPIC-1", ""])
+
+        self.assertEqual(mock_get.call_count, 1)
+        params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(params["jql"], 'key in ("EPIC-1","EPIC-2")')
+        self.assertEqual(params["fields"], "summary")
+        self.assertEqual(cache["EPIC-1"], "Payments")
+        self.assertEqual(cache["EPIC-2"], "Error")
+
+        # Negative results are cached too: no further requests
+        self.assertEqual(self.client.get_epic_summary("EPIC-2"), "Error")
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_get_issues_batches_and_falls_back(self, mock_get):
+        search = MagicMock(status_code=200)
+        search.content = json.dumps({"issues": [{"key": "TEST-2", "fields": {}}, {"key": "TEST-1", "fields": {}}]}).encode()
+        mock_get.return_value = search
+
+        found = self.client.get_issues(["test-1", "TEST-2", "TEST-3"])
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["jql"], 'key in ("TEST-1","TEST-2","TEST-3")')
+        self.assertEqual(sorted(found), ["TEST-1", "TEST-2"])
+
+        def reject_search(url, params=None, **kwargs):
+            if params is not None:
+                return MagicMock(status_code=400, text="bad key")
+            response = MagicMock(status_code=200 if url.endswith("TEST-1") else 404)
+            response.json.return_value = {"key": "TEST-1", "fields": {}}
+            return response
+
+        mock_get.reset_mock()
+        mock_get.side_effect = reject_search
+        found = self.client.get_issues(["TEST-1", "TEST-3"])
+        self.assertEqual(list(found), ["TEST-1"])
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_summary_cache_ttl_and_lru(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SummaryCache(os.path.join(tmp, "summaries.db"), ttl=60, max_entries=2)
+            cache.put("EPIC-1", "One")
+            cache.put("EPIC-2", "Two")
+            time.sleep(0.01)
+            self.assertEqual(cache.get("EPIC-1"), "One")  # EPIC-2 is now least recently used
+            time.sleep(0.01)
+            cache.put("EPIC-3", "Three")
+            self.assertEqual(cache.get_many(["EPIC-1", "EPIC-2", "EPIC-3"]), {"EPIC-1": "One", "EPIC-3": "Three"})
+
+            cache.ttl = -1
+            self.assertIsNone(cache.get("EPIC-1"))
+            self.assertEqual(cache.stats()["expired"], 2)
+            cache.close()
+
+    @patch('requests.Session.get')
+    def test_epic_summary_uses_disk_cache(self, mock_get):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SummaryCache(os.path.join(tmp, "summaries.db"))
+            cache.put("EPIC-9", "Cached Epic")
+            client = JiraClient(self.config, summary_cache=cache)
+
+            self.assertEqual(client.get_epic_summary("EPIC-9"), "Cached Epic")
+            mock_get.assert_not_called()
+            cache.close()
+
+    def test_session_pool_config(self):
+        os.environ["JIRA_POOL_MAXSIZE"] = "7"
+        os.environ["JIRA_GZIP"] = "False"
+        try:
+            client = JiraClient(ConfigLoader())
+        finally:
+            del os.environ["JIRA_POOL_MAXSIZE"]
+            del os.environ["JIRA_GZIP"]
+
+        adapter = client.session.get_adapter("https://mock.jira.com")
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(client.session.headers["Accept-Encoding"], "identity")
+        self.assertEqual(client.connection_stats(), {"requests": 0, "opened": 0, "reused": 0})
+
 if __name__ == '__main__':
     unittest.main()